@@ -2,47 +2,185 @@
 
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import logging
 
-from .central_control import CentralControl
-from .const import PLATFORMS
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-type CentralControlConfigEntry = ConfigEntry[CentralControl]
+from .central_control import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
+    CentralControl,
+    CentralControlError,
+)
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    DOMAIN,
+    PLATFORMS,
+    SERVICE_RESCAN,
+)
+from .coordinator import CentralControlCoordinator
+from .discovery import (
+    async_discover,
+    async_load_snapshot,
+    async_remove_snapshot,
+    async_save_snapshot,
+)
+from .manager import DATA_MANAGER, CentralControlManager
+from .models import CentralControlConfigEntry, CentralControlData
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the CentralControl manager and services."""
+
+    hass.data[DATA_MANAGER] = CentralControlManager(hass)
+
+    async def _async_rescan(call: ServiceCall) -> None:
+        """Rediscover the items of all loaded CentralControls."""
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if entry.state is ConfigEntryState.LOADED:
+                await async_rescan_entry(hass, entry)
+
+    hass.services.async_register(DOMAIN, SERVICE_RESCAN, _async_rescan)
+
+    return True
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: CentralControlConfigEntry
 ) -> bool:
-    """Set up CentralControl from a config entry."""
+    """Set up CentralControl from a config entry.
+
+    Home Assistant sets up the entries of all CentralControls concurrently,
+    they share the HTTP session and request budget of the manager.
+
+    Entities are created from the discovery snapshot of the last start if
+    there is one and reconciled with a fresh discovery in the background,
+    only the first setup waits on the CentralControl.
+    """
 
     address = entry.data["host_address"]
     cookie = entry.data.get("gw_token", None)
     invert_position = entry.data.get("invert_position", False)
     prefix = entry.data.get("prefix", None)
+    manager = hass.data[DATA_MANAGER]
 
     central_control = CentralControl(
         address=address,
         cookie=cookie,
         invert_position=invert_position,
         prefix=prefix,
+        session=manager.session,
+        max_concurrent_requests=entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        shared_limiter=manager.limiter,
+        min_timeout=entry.options.get(CONF_TIMEOUT_MIN, MIN_TIMEOUT),
+        max_timeout=entry.options.get(CONF_TIMEOUT_MAX, MAX_TIMEOUT),
     )
-    entry.runtime_data = central_control
 
-    item_list: dict
-    try:
-        item_list = await central_control.get_item_list(item_type="group")
-    except TimeoutError:
-        return False
+    discovery = await async_load_snapshot(hass, entry.entry_id, invert_position)
+    rediscover = discovery is not None
+    if discovery is None:
+        try:
+            discovery = await async_discover(central_control)
+        except CentralControlError as err:
+            await central_control.async_close()
+            raise ConfigEntryNotReady(str(err)) from err
 
-    if item_list.get("result", {}).get("item_list") is None:
-        return False
+        if discovery is None:
+            await central_control.async_close()
+            return False
+        await async_save_snapshot(hass, entry.entry_id, discovery)
+
+    central_control.set_item_types(discovery.item_types)
+    central_control.set_group_members(discovery.members)
+    coordinator = CentralControlCoordinator(hass, entry, central_control)
+    entry.runtime_data = CentralControlData(
+        central_control=central_control,
+        coordinator=coordinator,
+        discovery=discovery,
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # All entities are subscribed now, fetch their state in one batch.
+    coordinator.async_start()
+    entry.async_on_unload(manager.async_register(coordinator))
+
+    if rediscover:
+        entry.async_create_background_task(
+            hass,
+            async_rescan_entry(hass, entry),
+            f"{DOMAIN} rediscovery {entry.title}",
+        )
+
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(
+    hass: HomeAssistant, entry: CentralControlConfigEntry
+) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.central_control.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: CentralControlConfigEntry
+) -> None:
+    """Remove the discovery snapshot of a removed entry."""
+    await async_remove_snapshot(hass, entry.entry_id)
+
+
+async def async_rescan_entry(
+    hass: HomeAssistant, entry: CentralControlConfigEntry
+) -> None:
+    """Rediscover the items of an entry and reload it if they changed.
+
+    The snapshot is updated, the devices of vanished items are removed with
+    their entities and the reload adds the entities of new items.
+    """
+
+    try:
+        discovery = await async_discover(entry.runtime_data.central_control)
+    except CentralControlError as err:
+        _LOGGER.warning("Rescan of %s failed: %s", entry.title, err)
+        return
+
+    if discovery is None:
+        _LOGGER.warning("Rescan of %s failed", entry.title)
+        return
+
+    if discovery == entry.runtime_data.discovery:
+        return
+
+    _LOGGER.info("Items of %s changed, reloading", entry.title)
+    await async_save_snapshot(hass, entry.entry_id, discovery)
+
+    # Sensors use the numeric item id, covers and lights its string form.
+    keep = {entry.entry_id, *map(str, discovery.item_ids)}
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if not any(
+            domain == DOMAIN and str(identifier) in keep
+            for domain, identifier in device.identifiers
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+    hass.config_entries.async_schedule_reload(entry.entry_id)
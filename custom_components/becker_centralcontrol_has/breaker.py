@@ -0,0 +1,82 @@
+"""Circuit breaker guarding the requests to a CentralControl."""
+
+from enum import StrEnum
+import time
+
+
+class BreakerState(StrEnum):
+    """States of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Pause requests after repeated failures.
+
+    After failure_threshold consecutive failures the breaker opens and all
+    requests are rejected. Once reset_timeout seconds have passed it is half
+    open and lets a single probe request through. A successful probe closes
+    the breaker again, a failed one reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60) -> None:
+        """Init.
+
+        failure_threshold -- consecutive failures after which the breaker opens
+        reset_timeout -- seconds the breaker stays open before a probe is allowed
+        """
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the current state."""
+
+        if self._opened_at is None:
+            return BreakerState.CLOSED
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return BreakerState.OPEN
+        return BreakerState.HALF_OPEN
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+
+        return self._failures
+
+    def allow_request(self, probe: bool = False) -> bool:
+        """Return if a request may be sent and reserve the probe if needed."""
+
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return True
+        if state is BreakerState.OPEN or not probe or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Give up a reserved probe without a result, e.g. on cancellation."""
+
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the breaker if needed."""
+
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
@@ -1,9 +1,80 @@
 """Representation of a Becker Antriebe GmbH CentralControl."""
 
 import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import AsyncExitStack
+from functools import partial
 import json
+import logging
+import random
+import time
+from typing import Any
 
-import requests
+import aiohttp
+
+from .breaker import BreakerState, CircuitBreaker
+from .codec import FrameDecoder, encode
+from .limiter import PRIORITY_COMMAND, PRIORITY_POLL, RequestLimiter
+from .metrics import RequestMetrics
+from .tuning import LatencyModel
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 2
+
+# Request timeout in seconds until latencies were measured and its default bounds.
+DEFAULT_TIMEOUT = 10
+MIN_TIMEOUT = 3
+MAX_TIMEOUT = 30
+
+# States fetched less than this many seconds ago are served from the cache.
+STATE_COALESCE_WINDOW = 0.5
+# Commands issued within this many seconds are sent as one batch.
+COMMAND_BATCH_WINDOW = 0.02
+# Idempotent reads are retried with jittered exponential backoff.
+READ_RETRIES = 2
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 5.0
+# Seconds the controller may hold a deviced.wait_for_changes long poll.
+LISTEN_TIMEOUT = 25
+# Groups whose members are looked up per request.
+MEMBER_LOOKUP_CHUNK = 50
+# JSON-RPC error code of methods the controller does not implement.
+METHOD_NOT_FOUND = -32601
+
+# State calls and their id parameter needed per item type. The group state
+# holds value and motion of groups, the item state the values of remotes.
+STATE_METHODS = {
+    "group": (("deviced.group_get_state", "group_id"),),
+    "remote": (("deviced.item_get_state", "item_id"),),
+}
+# Both calls, the item state overrides the group state when merged.
+MERGED_STATE_METHODS = (
+    ("deviced.group_get_state", "group_id"),
+    ("deviced.item_get_state", "item_id"),
+)
+
+
+def _response_state(response: dict) -> dict:
+    """Return the state of a get_state response, empty if the call failed."""
+
+    return (response.get("result") or {}).get("state") or {}
+
+
+class CentralControlError(Exception):
+    """Base error of the CentralControl client."""
+
+
+class CentralControlConnectionError(CentralControlError):
+    """The CentralControl did not answer or sent an invalid response."""
+
+
+class CentralControlUnavailableError(CentralControlConnectionError):
+    """Requests are paused because the circuit breaker is open."""
+
+
+class CentralControlNotSupportedError(CentralControlError):
+    """The CentralControl does not implement the requested method."""
 
 
 class CentralControl:
@@ -15,6 +86,11 @@ class CentralControl:
         cookie: str | None = None,
         prefix: str = "",
         invert_position: bool = False,
+        session: aiohttp.ClientSession | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        shared_limiter: RequestLimiter | None = None,
+        min_timeout: float = MIN_TIMEOUT,
+        max_timeout: float = MAX_TIMEOUT,
     ) -> None:
         """Init.
 
@@ -22,6 +98,11 @@ class CentralControl:
         cookie -- in case you want to connect through gw.b-tronic.net
         prefix -- prefix for the entity names
         invert_position -- invert the position display
+        session -- aiohttp session to use, a dedicated keep-alive session is created if None
+        max_concurrent_requests -- maximum number of requests in flight, further requests are queued
+        shared_limiter -- limiter shared with other CentralControls, bounds their requests in flight together
+        min_timeout -- lower bound in seconds of the request timeout tuned to the latency
+        max_timeout -- upper bound in seconds of the request timeout tuned to the latency
         """
 
         self._prefix = f"{prefix}_" if prefix else ""
@@ -35,6 +116,29 @@ class CentralControl:
         if cookie is not None:
             self._headers["Cookie"] = cookie
 
+        self._session = session
+        self._owns_session = session is None
+        self._limiter = RequestLimiter(max_concurrent_requests)
+        self._shared_limiter = shared_limiter
+        self._breaker = CircuitBreaker()
+        self._metrics = RequestMetrics()
+        self._latency = LatencyModel(
+            min(max(DEFAULT_TIMEOUT, min_timeout), max_timeout),
+            min_timeout,
+            max_timeout,
+        )
+
+        self._state_requests: dict[int, asyncio.Task] = {}
+        self._state_cache: dict[int, tuple[float, dict]] = {}
+        self._state_hits = 0
+        self._state_misses = 0
+
+        self._command_queue: dict[int, tuple[str, Any, list[asyncio.Future]]] = {}
+        self._command_flush: asyncio.Task | None = None
+        # Leaf groups of every parent group, largest parent first.
+        self._group_leaves: dict[int, frozenset[int]] = {}
+        self._item_types: dict[int, str | None] = {}
+
     @property
     def prefix(self) -> str:
         """Return the prefix."""
@@ -47,27 +151,285 @@ class CentralControl:
 
         return self._invert_position
 
+    @property
+    def state_request_stats(self) -> dict[str, int]:
+        """Return how many get_state calls were served without a request.
+
+        Only external callers use get_state, the integration does not.
+        """
+
+        return {"hits": self._state_hits, "misses": self._state_misses}
+
+    @property
+    def limiter_stats(self) -> dict[str, int | float]:
+        """Return queue depth and wait times of the request limiter."""
+
+        return self._limiter.stats
+
+    @property
+    def breaker_state(self) -> BreakerState:
+        """Return the state of the circuit breaker."""
+
+        return self._breaker.state
+
+    @property
+    def breaker_failures(self) -> int:
+        """Return the number of consecutive failed requests."""
+
+        return self._breaker.failures
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        """Return the request metrics."""
+
+        return self._metrics
+
+    @property
+    def latency(self) -> LatencyModel:
+        """Return the measured latency, which sets the request timeout."""
+
+        return self._latency
+
+    def set_item_types(self, item_types: dict[int, str | None]) -> None:
+        """Set the item type of every item, used to plan state requests."""
+
+        self._item_types = dict(item_types)
+
+    def set_group_members(self, members: dict[int, Iterable[int]]) -> None:
+        """Set the member groups of the parent groups.
+
+        Commands queued for all leaf groups of a parent group are collapsed
+        into one command to the parent group.
+        """
+
+        def leaves(group_id: int, seen: frozenset[int]) -> frozenset[int]:
+            if group_id not in members or group_id in seen:
+                return frozenset((group_id,))
+            return frozenset().union(
+                *(leaves(member, seen | {group_id}) for member in members[group_id])
+            )
+
+        group_leaves = {group_id: leaves(group_id, frozenset()) for group_id in members}
+        self._group_leaves = dict(
+            sorted(group_leaves.items(), key=lambda item: len(item[1]), reverse=True)
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating the dedicated one on first use."""
+
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the dedicated HTTP session, shared sessions are left open."""
+
+        if self._command_flush is not None:
+            await self._command_flush
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def _jrpc_request(
-        self, data: dict | list[dict], timeout: int = 10
+        self,
+        data: dict | list[dict],
+        timeout: float | None = None,
+        priority: int = PRIORITY_POLL,
+        probe: bool = False,
+        on_message: Callable[[Any], None] | None = None,
+        long_poll: bool = False,
     ) -> dict | list | None:
+        """Send a JSON-RPC request or batch and return the decoded response.
+
+        The response is decoded while it streams in and on_message is called
+        with every message as soon as its frame is complete. Responses split
+        into several frames are joined into one batch response. A truncated
+        last frame is dropped if complete frames preceded it.
+
+        Without timeout the request times out after the latency measured
+        for requests of its size. Long polls bypass the request limiters and
+        are recorded without latency, the controller holds them until
+        something changed.
+
+        Raises CentralControlUnavailableError while the circuit breaker is
+        open and CentralControlConnectionError if the request failed.
+        """
+        if not self._breaker.allow_request(probe):
+            raise CentralControlUnavailableError(
+                f"Requests to {self.address} are paused after repeated failures"
+            )
+
+        payload = encode(data)
+        method = RequestMetrics.method_key(data)
+        calls = len(data) if isinstance(data, list) else 1
+        if timeout is None:
+            timeout = self._latency.timeout(calls)
+        decoder = FrameDecoder()
+        messages: list[Any] = []
+        received = 0
+
         try:
-            async with asyncio.timeout(timeout):
-                response: requests.Response = await asyncio.to_thread(
-                    requests.post,
-                    url=self.address,
-                    data=json.dumps(data) + "\0",
-                    headers=self._headers,
+            async with AsyncExitStack() as slots:
+                if not long_poll:
+                    await slots.enter_async_context(self._limiter.slot(priority))
+                    if self._shared_limiter is not None:
+                        await slots.enter_async_context(
+                            self._shared_limiter.slot(priority)
+                        )
+                start = time.monotonic()
+                async with (
+                    asyncio.timeout(timeout),
+                    self._get_session().post(
+                        self.address,
+                        data=payload,
+                        headers=self._headers,
+                    ) as response,
+                ):
+                    async for chunk in response.content.iter_any():
+                        received += len(chunk)
+                        for message in decoder.feed(chunk):
+                            messages.append(message)
+                            if on_message is not None:
+                                on_message(message)
+                    try:
+                        tail = decoder.close()
+                    except json.decoder.JSONDecodeError:
+                        if not messages:
+                            raise
+                        _LOGGER.debug(
+                            "Dropped truncated frame of %s bytes from %s",
+                            decoder.pending,
+                            self.address,
+                        )
+                        tail = []
+                    for message in tail:
+                        messages.append(message)
+                        if on_message is not None:
+                            on_message(message)
+                latency = time.monotonic() - start
+
+            if not messages:
+                raise json.decoder.JSONDecodeError("Empty response", "", 0)
+        except (TimeoutError, aiohttp.ClientError, json.decoder.JSONDecodeError) as err:
+            self._breaker.record_failure()
+            if isinstance(err, TimeoutError) and not long_poll:
+                self._latency.record_timeout()
+            self._metrics.record_failure(
+                method, calls, len(payload), timeout=isinstance(err, TimeoutError)
+            )
+            raise CentralControlConnectionError(
+                f"Request to {self.address} failed: {err!r}"
+            ) from err
+        except asyncio.CancelledError:
+            if probe:
+                self._breaker.release_probe()
+            raise
+
+        self._breaker.record_success()
+        if not long_poll:
+            self._latency.record(calls, latency)
+        self._metrics.record_success(
+            method, calls, None if long_poll else latency, len(payload), received
+        )
+        if len(messages) == 1:
+            return messages[0]
+        return [
+            response
+            for message in messages
+            for response in (message if isinstance(message, list) else [message])
+        ]
+
+    async def _jrpc_read(
+        self,
+        data: dict | list[dict],
+        on_message: Callable[[Any], None] | None = None,
+    ) -> dict | list | None:
+        """Send an idempotent request, retrying it with jittered backoff.
+
+        on_message may see a message again if the request is retried.
+        """
+
+        for attempt in range(READ_RETRIES + 1):
+            try:
+                return await self._jrpc_request(data=data, on_message=on_message)
+            except CentralControlUnavailableError:
+                raise
+            except CentralControlConnectionError as err:
+                if attempt == READ_RETRIES:
+                    raise
+                delay = random.uniform(
+                    0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt)
                 )
+                _LOGGER.debug("%s, retrying in %.2f s", err, delay)
+                await asyncio.sleep(delay)
+        return None
 
-                return json.loads(response.text.replace("\0", ""))
-        except TimeoutError:
-            if data is list:
-                return []
-            return {}
-        except json.decoder.JSONDecodeError:
-            if data is list:
-                return []
-            return {}
+    async def async_probe(self, item_id: int) -> None:
+        """Send a single lightweight request to test a half open breaker."""
+
+        await self._jrpc_request(
+            data={
+                "jsonrpc": "2.0",
+                "id": 0,
+                "params": {"item_id": item_id},
+                "method": "deviced.item_get_state",
+            },
+            probe=True,
+        )
+
+    async def wait_for_changes(
+        self, cursor: int | None = None
+    ) -> tuple[int, dict[int, dict] | None]:
+        """Wait for state changes of items since cursor.
+
+        The deviced.wait_for_changes call is held by the controller for up to
+        LISTEN_TIMEOUT seconds until an item changed. Its result contains:
+        * cursor: the cursor to pass to the next call (Number)
+        * changes: the changed items, each with item_id and the combined state (Array)
+        * reset: True if changes since cursor are unknown, e.g. for the first call (optional Bool)
+
+        Returns the next cursor and the changed states by item id, None if all
+        items have to be polled again.
+
+        Raises CentralControlNotSupportedError if the controller does not
+        implement the call.
+        """
+        data = await self._jrpc_request(
+            data={
+                "jsonrpc": "2.0",
+                "id": 0,
+                "params": {"cursor": cursor, "timeout": LISTEN_TIMEOUT},
+                "method": "deviced.wait_for_changes",
+            },
+            timeout=LISTEN_TIMEOUT + 10,
+            long_poll=True,
+        )
+
+        if not isinstance(data, dict):
+            raise CentralControlConnectionError(
+                f"Invalid response to deviced.wait_for_changes: {data!r}"
+            )
+        if (error := data.get("error")) is not None:
+            if error.get("code") == METHOD_NOT_FOUND:
+                raise CentralControlNotSupportedError(
+                    f"{self.address} does not support deviced.wait_for_changes"
+                )
+            raise CentralControlError(
+                f"deviced.wait_for_changes failed: {error.get('message')}"
+            )
+
+        result = data.get("result") or {}
+        next_cursor = result.get("cursor", cursor)
+        if result.get("reset"):
+            return next_cursor, None
+
+        changes = {
+            change["item_id"]: change.get("state") or {}
+            for change in result.get("changes", [])
+            if isinstance(change, dict) and "item_id" in change
+        }
+        return next_cursor, changes
 
     async def get_item_list(
         self,
@@ -101,8 +463,10 @@ class CentralControl:
         -------
         list of items
 
+        Raises CentralControlConnectionError if the list could not be retrieved.
+
         """
-        return await self._jrpc_request(
+        return await self._jrpc_read(
             data={
                 "jsonrpc": "2.0",
                 "id": 0,
@@ -113,6 +477,102 @@ class CentralControl:
             }
         )
 
+    async def get_group_members(self, group_ids: Iterable[int]) -> dict[int, list[int]]:
+        """Get the member groups of the given groups.
+
+        The member groups of every group are listed with
+        deviced.deviced_get_item_list calls with list_type "groups" and the
+        group as parent_id. The receivers of the parent groups and their
+        members are listed the same way with list_type "receivers".
+
+        Returns a mapping of parent group id to the ids of its member groups.
+        Groups without member groups are omitted, as are parent groups with
+        receivers none of their members holds or whose receivers could not
+        be listed, commands to those cannot replace commands to the members.
+        """
+        group_ids = list(group_ids)
+
+        members: dict[int, list[int]] = {}
+        for parent_id, items in (
+            await self._get_child_lists(group_ids, "groups")
+        ).items():
+            member_ids = [
+                int(item["id"])
+                for item in items or []
+                if "id" in item
+                and item.get("item_type", "group") == "group"
+                and int(item["id"]) != parent_id
+            ]
+            if member_ids:
+                members[parent_id] = member_ids
+        if not members:
+            return {}
+
+        involved = {*members, *(member for ids in members.values() for member in ids)}
+        receivers: dict[int, set[int] | None] = {}
+        for group_id, items in (
+            await self._get_child_lists(involved, "receivers")
+        ).items():
+            receivers[group_id] = (
+                None
+                if items is None
+                else {int(item["id"]) for item in items if "id" in item}
+            )
+
+        collapsible: dict[int, list[int]] = {}
+        for parent_id, member_ids in members.items():
+            member_receivers = [receivers.get(member) for member in member_ids]
+            parent_receivers = receivers.get(parent_id)
+            if parent_receivers is None or None in member_receivers:
+                continue
+            if parent_receivers <= set().union(*member_receivers):
+                collapsible[parent_id] = member_ids
+            else:
+                _LOGGER.debug(
+                    "Group %s holds receivers of its own, commands are not collapsed",
+                    parent_id,
+                )
+        return collapsible
+
+    async def _get_child_lists(
+        self, group_ids: Iterable[int], list_type: str
+    ) -> dict[int, list[dict] | None]:
+        """List the items of type list_type in the given groups.
+
+        Batches with a deviced.deviced_get_item_list call per group are sent
+        one after another for MEMBER_LOOKUP_CHUNK groups each. Groups whose
+        call failed map to None.
+        """
+        group_ids = list(group_ids)
+        lists: dict[int, list[dict] | None] = dict.fromkeys(group_ids)
+
+        for start in range(0, len(group_ids), MEMBER_LOOKUP_CHUNK):
+            chunk = group_ids[start : start + MEMBER_LOOKUP_CHUNK]
+            data = await self._jrpc_read(
+                data=[
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "params": {"list_type": list_type, "parent_id": group_id},
+                        "method": "deviced.deviced_get_item_list",
+                    }
+                    for request_id, group_id in enumerate(chunk)
+                ]
+            )
+            if isinstance(data, dict):
+                data = [data]
+
+            for response in data or []:
+                if not isinstance(response, dict):
+                    continue
+                request_id = response.get("id")
+                if not isinstance(request_id, int) or not 0 <= request_id < len(chunk):
+                    continue
+                items = (response.get("result") or {}).get("item_list")
+                if isinstance(items, list):
+                    lists[chunk[request_id]] = items
+        return lists
+
     async def group_send_command(self, group_id: int, command: str, value) -> dict:
         """Send a command to a group.
 
@@ -153,15 +613,108 @@ class CentralControl:
         * switch with integer value 0 or 1
         * tempmode with integer value 0, 1, 2, 3
         * tempset with float value between 4.0 and 40.0
+
+        Commands are queued for COMMAND_BATCH_WINDOW seconds and sent as one
+        JSON-RPC batch. A later command to the same group replaces a queued
+        one, both callers then receive the response to the command sent.
+        The same command to all leaf groups of a parent group is sent to the
+        parent group once, see set_group_members.
         """
-        return await self._jrpc_request(
-            data={
+        return await self._queue_command(group_id, command, value)
+
+    async def group_send_commands(
+        self, commands: Iterable[tuple[int, str, Any]]
+    ) -> list[dict]:
+        """Send commands to several groups in one batch.
+
+        * commands: Iterable[tuple[int, str, Any]] -- group id, command and value
+
+        The commands are queued together, so they are sent in the same
+        JSON-RPC batch as described in group_send_command. Returns the
+        responses in the order of the commands.
+        """
+        futures = [
+            self._queue_command(group_id, command, value)
+            for group_id, command, value in commands
+        ]
+        return list(await asyncio.gather(*futures))
+
+    def _queue_command(
+        self, group_id: int, command: str, value: Any
+    ) -> asyncio.Future[dict]:
+        """Queue a command and return the future of its response."""
+
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+
+        queued = self._command_queue.get(group_id)
+        waiters = [*queued[2], future] if queued is not None else [future]
+        self._command_queue[group_id] = (command, value, waiters)
+
+        if self._command_flush is None:
+            self._command_flush = asyncio.create_task(self._flush_commands())
+
+        return future
+
+    async def _flush_commands(self) -> None:
+        """Send all queued commands as one batch and resolve their callers."""
+
+        await asyncio.sleep(COMMAND_BATCH_WINDOW)
+        queue, self._command_queue = self._command_queue, {}
+        self._command_flush = None
+        self._collapse_commands(queue)
+
+        batch = [
+            {
                 "jsonrpc": "2.0",
-                "id": 0,
+                "id": request_id,
                 "params": {"group_id": group_id, "command": command, "value": value},
                 "method": "deviced.group_send_command",
             }
-        )
+            for request_id, (group_id, (command, value, _)) in enumerate(queue.items())
+        ]
+
+        try:
+            data = await self._jrpc_request(
+                data=batch[0] if len(batch) == 1 else batch,
+                priority=PRIORITY_COMMAND,
+            )
+        except Exception as err:
+            for _, _, waiters in queue.values():
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+            return
+
+        if isinstance(data, dict):
+            data = [data]
+        responses = {
+            response.get("id"): response
+            for response in data or []
+            if isinstance(response, dict)
+        }
+
+        for request_id, (_, _, waiters) in enumerate(queue.values()):
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(responses.get(request_id, {}))
+
+    def _collapse_commands(
+        self, queue: dict[int, tuple[str, Any, list[asyncio.Future]]]
+    ) -> None:
+        """Replace the same command to all leaves of a parent group in place."""
+
+        for parent_id, leaves in self._group_leaves.items():
+            if parent_id in queue or not leaves <= queue.keys():
+                continue
+            commands = {queue[leaf][:2] for leaf in leaves}
+            if len(commands) != 1:
+                continue
+
+            waiters = [waiter for leaf in leaves for waiter in queue.pop(leaf)[2]]
+            queue[parent_id] = (*commands.pop(), waiters)
+            _LOGGER.debug(
+                "Collapsed %s commands into one to group %s", len(leaves), parent_id
+            )
 
     async def get_state(self, item_id) -> dict:
         """Get combined group and item state.
@@ -173,8 +726,43 @@ class CentralControl:
         * error_flags: the (collected) error states of the child devices (Array of Strings) (optional Array)
         * error_count: the number of erroneous devices (optional Number)
         * scheduled_cmd: True if there is a pending close command on this group. (optional Bool)
+
+        Concurrent calls for the same item share one in-flight request and
+        results younger than STATE_COALESCE_WINDOW seconds are reused.
+
+        The integration itself polls with get_states only, this method and
+        its cache serve external callers of the client. The hits and misses
+        in state_request_stats only count calls of this method.
         """
-        data: list = await self._jrpc_request(
+        cached = self._state_cache.get(item_id)
+        if cached is not None and time.monotonic() - cached[0] < STATE_COALESCE_WINDOW:
+            self._state_hits += 1
+            return cached[1]
+
+        task = self._state_requests.get(item_id)
+        if task is None:
+            self._state_misses += 1
+            task = asyncio.create_task(self._fetch_state(item_id))
+            self._state_requests[item_id] = task
+            task.add_done_callback(partial(self._state_request_done, item_id))
+        else:
+            self._state_hits += 1
+
+        return await asyncio.shield(task)
+
+    def _state_request_done(self, item_id: int, task: asyncio.Task) -> None:
+        """Drop a finished state request and cache its result."""
+
+        self._state_requests.pop(item_id, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        if state := task.result():
+            self._state_cache[item_id] = (time.monotonic(), state)
+        _LOGGER.debug("State request stats: %s", self.state_request_stats)
+
+    async def _fetch_state(self, item_id) -> dict:
+        """Fetch the combined group and item state of a single item."""
+        data: list = await self._jrpc_read(
             data=[
                 {
                     "jsonrpc": "2.0",
@@ -200,3 +788,93 @@ class CentralControl:
         item_state = data[1].get("result", {}).get("state", {})
 
         return {**group_state, **item_state} if group_state or item_state else None
+
+    async def get_states(
+        self,
+        item_ids: Iterable[int],
+        on_state: Callable[[int, dict], None] | None = None,
+        merged: bool = False,
+    ) -> dict[int, dict]:
+        """Get the state of many items in one request.
+
+        A single JSON-RPC batch is sent. Items of a type set with
+        set_item_types are queried with the calls in STATE_METHODS only,
+        items of unknown type and all items if merged is True with both
+        deviced.group_get_state and deviced.item_get_state. The responses
+        are matched back to their items by id and merged like in get_state.
+
+        on_state is called with the item id and state as soon as all
+        responses of an item arrived, while the rest of the batch may still
+        be streaming in.
+
+        Returns a mapping of item id to state, items without state are omitted.
+        """
+        batch: list[dict] = []
+        item_by_request_id: dict[int, int] = {}
+        request_ids: dict[int, list[int]] = {}
+
+        for item_id in item_ids:
+            methods = MERGED_STATE_METHODS
+            if not merged:
+                methods = STATE_METHODS.get(
+                    self._item_types.get(item_id), MERGED_STATE_METHODS
+                )
+            for method, param in methods:
+                request_id = len(batch)
+                item_by_request_id[request_id] = item_id
+                request_ids.setdefault(item_id, []).append(request_id)
+                batch.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "params": {param: item_id},
+                        "method": method,
+                    }
+                )
+
+        if not batch:
+            return {}
+
+        received: dict[int, dict] = {}
+
+        def dispatch(message: Any) -> None:
+            """Pass on the state of every item whose responses are complete."""
+            for response in message if isinstance(message, list) else [message]:
+                if not isinstance(response, dict):
+                    continue
+                request_id = response.get("id")
+                if request_id not in item_by_request_id:
+                    continue
+                received[request_id] = response
+                item_id = item_by_request_id[request_id]
+                if all(other in received for other in request_ids[item_id]):
+                    state: dict = {}
+                    for other in request_ids[item_id]:
+                        state.update(_response_state(received[other]))
+                    if state:
+                        on_state(item_id, state)
+
+        data = await self._jrpc_read(
+            data=batch, on_message=dispatch if on_state is not None else None
+        )
+        # A single response may arrive as a frame of its own.
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            return {}
+
+        # Sort by request id so the item state overrides the group state.
+        responses = sorted(
+            (response for response in data if isinstance(response, dict)),
+            key=lambda response: response.get("id", -1),
+        )
+
+        states: dict[int, dict] = {}
+        for response in responses:
+            item_id = item_by_request_id.get(response.get("id"))
+            state = _response_state(response)
+            if item_id is None or not state:
+                continue
+            states.setdefault(item_id, {}).update(state)
+
+        return states
@@ -0,0 +1,96 @@
+"""Framing codec for the cc51rpc.cgi JSON-RPC endpoint.
+
+Every message is a JSON document terminated by a NUL byte. orjson is used
+when it is available, the standard library json module otherwise. Response
+streams are decoded incrementally by FrameDecoder.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+TERMINATOR = b"\0"
+
+
+def encode(data: Any) -> bytes:
+    """Encode a JSON-RPC request or batch into a terminated frame."""
+
+    if orjson is not None:
+        return orjson.dumps(data) + TERMINATOR
+    return json.dumps(data, separators=(",", ":")).encode() + TERMINATOR
+
+
+def loads(payload: bytes | memoryview) -> Any:
+    """Parse a JSON document from a byte buffer without copying it if possible.
+
+    Raises json.JSONDecodeError if the payload is not valid JSON.
+    """
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(bytes(payload))
+
+
+class FrameDecoder:
+    """Incremental decoder of a stream of terminated frames.
+
+    Chunks are fed as they arrive and every frame is decoded as soon as its
+    terminator was received. Concatenated frames and frames split across
+    chunks are handled, empty frames are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self._buffer = bytearray()
+        # Bytes of the buffer already searched for a terminator.
+        self._scanned = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes of an incomplete frame."""
+
+        return len(self._buffer)
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk and return the messages of all frames it completed.
+
+        Raises json.JSONDecodeError if a completed frame is not valid JSON.
+        """
+
+        buffer = self._buffer
+        buffer += chunk
+        messages = []
+        start = 0
+
+        with memoryview(buffer) as view:
+            while (end := buffer.find(TERMINATOR, max(start, self._scanned))) != -1:
+                if end > start:
+                    messages.append(loads(view[start:end]))
+                start = end + 1
+
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        return messages
+
+    def close(self) -> list[Any]:
+        """Decode a final frame which is missing its terminator.
+
+        Raises json.JSONDecodeError if the stream ended inside a frame, the
+        buffered bytes are kept so they can be inspected via pending.
+        """
+
+        if not self._buffer.strip():
+            self._buffer.clear()
+            self._scanned = 0
+            return []
+
+        message = loads(self._buffer)
+        self._buffer.clear()
+        self._scanned = 0
+        return [message]
@@ -3,14 +3,37 @@
 import ipaddress
 import logging
 from typing import Any
+from uuid import uuid4
 
 import voluptuous as vol
 
 from homeassistant import config_entries, exceptions
-from homeassistant.core import HomeAssistant
+from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
+from homeassistant.const import CONF_ID, CONF_NAME
+from homeassistant.data_entry_flow import section
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from .central_control import DEFAULT_MAX_CONCURRENT_REQUESTS, MAX_TIMEOUT, MIN_TIMEOUT
+from .const import (
+    CONF_AGGREGATES,
+    CONF_DEADBAND,
+    CONF_HEARTBEAT,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MEMBERS,
+    CONF_MIN_INTERVAL,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    COVER_MAPPING,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    DOMAIN,
+    THROTTLED_VALUE_TYPES,
+)
+from .models import aggregate_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +44,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "OptionsFlowHandler":
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(self, user_input=None) -> config_entries.ConfigFlowResult:
         """Handle the initial step."""
 
@@ -118,6 +149,188 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
+    """Handle the options of a CentralControl, the entry reloads on change."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Offer the settings and the aggregate covers."""
+
+        menu_options = ["settings", "add_aggregate"]
+        if self.config_entry.options.get(CONF_AGGREGATES):
+            menu_options.append("remove_aggregate")
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the connection and sensor options."""
+
+        errors = {}
+        if user_input is not None:
+            if user_input[CONF_SCAN_INTERVAL_MIN] > user_input[CONF_SCAN_INTERVAL_MAX]:
+                errors[CONF_SCAN_INTERVAL_MAX] = "scan_interval_range"
+            if user_input[CONF_TIMEOUT_MIN] > user_input[CONF_TIMEOUT_MAX]:
+                errors[CONF_TIMEOUT_MAX] = "timeout_range"
+            if not errors:
+                return self.async_create_entry(
+                    data={**self.config_entry.options, **user_input}
+                )
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MIN,
+                        default=options.get(
+                            CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MAX,
+                        default=options.get(
+                            CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Optional(
+                        CONF_TIMEOUT_MIN,
+                        default=options.get(CONF_TIMEOUT_MIN, MIN_TIMEOUT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                    vol.Optional(
+                        CONF_TIMEOUT_MAX,
+                        default=options.get(CONF_TIMEOUT_MAX, MAX_TIMEOUT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                    **{
+                        vol.Required(value_type): section(
+                            _throttle_schema(options.get(value_type, {})),
+                            {"collapsed": True},
+                        )
+                        for value_type in THROTTLED_VALUE_TYPES
+                    },
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_add_aggregate(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Define a cover aggregating covers with feedback."""
+
+        if self.config_entry.state is not config_entries.ConfigEntryState.LOADED:
+            return self.async_abort(reason="not_loaded")
+
+        discovery = self.config_entry.runtime_data.discovery
+        covers = {
+            str(item.id): item.name
+            for item in discovery.groups_of_types(COVER_MAPPING)
+            if item.feedback
+        }
+
+        errors = {}
+        if user_input is not None:
+            if not user_input[CONF_MEMBERS]:
+                errors[CONF_MEMBERS] = "no_members"
+            else:
+                options = self.config_entry.options
+                aggregate = {
+                    CONF_ID: uuid4().hex,
+                    CONF_NAME: user_input[CONF_NAME],
+                    CONF_MEMBERS: [
+                        int(item_id) for item_id in user_input[CONF_MEMBERS]
+                    ],
+                }
+                return self.async_create_entry(
+                    data={
+                        **options,
+                        CONF_AGGREGATES: [*options.get(CONF_AGGREGATES, []), aggregate],
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="add_aggregate",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NAME): cv.string,
+                    vol.Required(CONF_MEMBERS, default=[]): cv.multi_select(covers),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_remove_aggregate(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Remove aggregate covers and their entities."""
+
+        options = self.config_entry.options
+        aggregates = options.get(CONF_AGGREGATES, [])
+
+        if user_input is not None:
+            removed = set(user_input[CONF_AGGREGATES])
+            registry = er.async_get(self.hass)
+            for aggregate_id in removed:
+                entity_id = registry.async_get_entity_id(
+                    COVER_DOMAIN,
+                    DOMAIN,
+                    aggregate_unique_id(self.config_entry.entry_id, aggregate_id),
+                )
+                if entity_id is not None:
+                    registry.async_remove(entity_id)
+            return self.async_create_entry(
+                data={
+                    **options,
+                    CONF_AGGREGATES: [
+                        aggregate
+                        for aggregate in aggregates
+                        if aggregate[CONF_ID] not in removed
+                    ],
+                }
+            )
+
+        return self.async_show_form(
+            step_id="remove_aggregate",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_AGGREGATES, default=[]): cv.multi_select(
+                        {
+                            aggregate[CONF_ID]: aggregate[CONF_NAME]
+                            for aggregate in aggregates
+                        }
+                    ),
+                }
+            ),
+        )
+
+
+def _throttle_schema(settings: dict[str, Any]) -> vol.Schema:
+    """Return the schema of the publish throttle of a sensor value type."""
+
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_DEADBAND, default=settings.get(CONF_DEADBAND, 0.0)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+            vol.Optional(
+                CONF_MIN_INTERVAL, default=settings.get(CONF_MIN_INTERVAL, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+            vol.Optional(
+                CONF_HEARTBEAT, default=settings.get(CONF_HEARTBEAT, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+        }
+    )
+
+
 def _is_valid_ip(ip: str) -> bool:
     """Check for valid ip address."""
 
@@ -1,5 +1,6 @@
 """Constants for the Becker Antriebe CentralControl integration."""
 
+from datetime import timedelta
 from enum import StrEnum
 
 from homeassistant.components.cover import CoverDeviceClass
@@ -9,6 +10,59 @@ PLATFORMS: list[Platform] = [Platform.COVER, Platform.LIGHT, Platform.SENSOR]
 DOMAIN = "becker_centralcontrol_has"
 MANUFACTURER = "Becker Antriebe GmbH"
 
+SCAN_INTERVAL = timedelta(seconds=30)
+# Interval used while groups are moving or were commanded recently.
+FAST_SCAN_INTERVAL = timedelta(milliseconds=500)
+# Seconds a group is polled fast after a command was sent to it.
+COMMAND_FAST_POLL_TIME = 10
+# Interval the position of a moving cover is interpolated at.
+MOTION_UPDATE_INTERVAL = timedelta(seconds=1)
+# Safety net poll interval while state changes are pushed by the listener.
+LISTEN_SCAN_INTERVAL = timedelta(minutes=5)
+# Seconds to wait before reconnecting a failed listener, doubled after
+# every further failure up to LISTEN_RETRY_DELAY_MAX.
+LISTEN_RETRY_DELAY = 30
+LISTEN_RETRY_DELAY_MAX = 1800
+# Consecutive error responses after which the listener is given up.
+LISTEN_MAX_ERRORS = 3
+# Time span and maximum number of readings sensor statistics are kept for.
+STATS_WINDOW = timedelta(minutes=15)
+STATS_CAPACITY = 1024
+
+# State fields compared to decide whether an item changed.
+STATE_FIELDS = (
+    "value",
+    "mode",
+    "error_flags",
+    "moving_up",
+    "moving_down",
+    "value-sun",
+    "value-wind",
+    "value-rain",
+    "value-temp",
+    "value-dawn",
+)
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_SCAN_INTERVAL_MIN = "scan_interval_min"
+CONF_SCAN_INTERVAL_MAX = "scan_interval_max"
+# Default bounds in seconds of the scan interval tuned to the latency.
+DEFAULT_SCAN_INTERVAL_MIN = 10
+DEFAULT_SCAN_INTERVAL_MAX = 300
+# Bounds of the request timeout tuned to the latency.
+CONF_TIMEOUT_MIN = "timeout_min"
+CONF_TIMEOUT_MAX = "timeout_max"
+CONF_DEADBAND = "deadband"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_HEARTBEAT = "heartbeat"
+# Sensor value types with deadband, minimum interval and heartbeat options.
+THROTTLED_VALUE_TYPES = ("sun", "wind", "temp", "dawn")
+# Covers aggregating other covers, each with an id, a name and members.
+CONF_AGGREGATES = "aggregates"
+CONF_MEMBERS = "members"
+
+SERVICE_RESCAN = "rescan"
+
 
 class DEVICE_TYPES(StrEnum):
     """Central Control device types."""
@@ -0,0 +1,431 @@
+"""Coordinator polling the state of all CentralControl items."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .breaker import BreakerState
+from .central_control import (
+    CentralControl,
+    CentralControlConnectionError,
+    CentralControlError,
+    CentralControlNotSupportedError,
+)
+from .const import (
+    COMMAND_FAST_POLL_TIME,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    DOMAIN,
+    FAST_SCAN_INTERVAL,
+    LISTEN_MAX_ERRORS,
+    LISTEN_RETRY_DELAY,
+    LISTEN_RETRY_DELAY_MAX,
+    LISTEN_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+    STATE_FIELDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _compact_state(state: dict[str, Any]) -> tuple:
+    """Return the compared fields of a state as hashable tuple."""
+    return tuple(
+        tuple(value) if isinstance(value := state.get(field), list) else value
+        for field in STATE_FIELDS
+    )
+
+
+class CentralControlCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
+    """Fetch the state of every subscribed item in one batched request.
+
+    Entities subscribe with their item id as context. On each tick the ids of
+    all subscribed entities are polled with a single JSON-RPC batch and the
+    results are fanned out to the entities.
+
+    While groups are moving or were commanded recently the coordinator ticks
+    at FAST_SCAN_INTERVAL and only polls those groups. All items are still
+    polled every scan interval. It starts at SCAN_INTERVAL and follows the
+    latency the CentralControl needs for a batch of the subscribed items,
+    bounded by the minimum and maximum scan interval options.
+
+    While the circuit breaker of the CentralControl is open polling pauses and
+    the entities become unavailable. Once it is half open a single probe is
+    sent before polling resumes.
+
+    The last state of every item is kept in compact form and only entities
+    whose item changed are notified, skipped writes are counted. After a
+    successful update the entities of a changed item are notified as soon as
+    its state arrived, while the rest of the batch is still streaming in.
+
+    If the CentralControl supports deviced.wait_for_changes a listener pushes
+    changed states to the entities as they happen. While it is connected
+    polling only runs every LISTEN_SCAN_INTERVAL as a safety net, polling at
+    the usual intervals resumes if the listener fails or is not supported.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        central_control: CentralControl,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
+        self.central_control = central_control
+        self._moving: set[int] = set()
+        self._commanded_until: dict[int, float] = {}
+        self._last_full_poll = 0.0
+
+        self._last_states: dict[int, tuple] = {}
+        # Items changed by the last update, None notifies all entities.
+        self._changed: set[int] | None = None
+        # Items whose state was received by the last update.
+        self.received: set[int] = set()
+        # Listeners by item id and those without item.
+        self._item_listeners: dict[int, list[CALLBACK_TYPE]] = {}
+        self._unfiltered_listeners: list[CALLBACK_TYPE] = []
+        self._refresh_lock = asyncio.Lock()
+        self.skipped_writes = 0
+        self.skipped_writes_total = 0
+        self.listening = False
+        self.scan_interval = self._clamp_scan_interval(SCAN_INTERVAL.total_seconds())
+        self._background: asyncio.Task | None = None
+
+    @callback
+    def async_mark_active(self, item_id: int) -> None:
+        """Poll an item fast for a while, e.g. after a command was sent.
+
+        Items without feedback are not subscribed and have no state to poll.
+        """
+        if item_id not in self._item_listeners:
+            return
+        self._commanded_until[item_id] = time.monotonic() + COMMAND_FAST_POLL_TIME
+        if not self.listening:
+            self.update_interval = FAST_SCAN_INTERVAL
+
+    @property
+    def unfiltered_listeners(self) -> int:
+        """Return the number of listeners without item.
+
+        They are notified on every update and not counted as skipped writes,
+        they have to skip unchanged writes themselves.
+        """
+        return len(self._unfiltered_listeners)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, of a single item if context is its id."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            listeners = self._unfiltered_listeners
+        else:
+            listeners = self._item_listeners.setdefault(context, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_item_listener() -> None:
+            """Remove the listener."""
+            remove_listener()
+            listeners.remove(update_callback)
+            if not listeners and context is not None:
+                del self._item_listeners[context]
+
+        return remove_item_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities whose item changed and those without item."""
+        if self._changed is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback in list(self._unfiltered_listeners):
+            update_callback()
+        skipped = 0
+        for item_id, update_callbacks in list(self._item_listeners.items()):
+            if item_id not in self._changed:
+                skipped += len(update_callbacks)
+                continue
+            for update_callback in list(update_callbacks):
+                update_callback()
+
+        self.skipped_writes = skipped
+        self.skipped_writes_total += skipped
+        _LOGGER.debug("Skipped %s unchanged state writes", skipped)
+
+    @callback
+    def _async_dispatch_state(
+        self,
+        dispatch: dict[int, list[CALLBACK_TYPE]],
+        item_id: int,
+        state: dict[str, Any],
+    ) -> None:
+        """Notify the entities of an item whose state arrived mid-batch."""
+        if not (update_callbacks := dispatch.get(item_id)):
+            return
+
+        compact = _compact_state(state)
+        if self._last_states.get(item_id) == compact:
+            return
+        self._last_states[item_id] = compact
+        self.data[item_id] = state
+        for update_callback in list(update_callbacks):
+            update_callback()
+
+    @callback
+    def async_start(self) -> None:
+        """Fetch the first state and listen for changes in the background.
+
+        Entities are added before their state is known and fill in once the
+        first batch landed, setup does not wait on the CentralControl.
+        """
+        self._background = self.config_entry.async_create_background_task(
+            self.hass, self._async_run(), f"{DOMAIN} {self.name}"
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop the listener and polling."""
+        if self._background is not None:
+            self._background.cancel()
+            self._background = None
+        await super().async_shutdown()
+
+    async def _async_run(self) -> None:
+        """Fetch the state of all items in one batch and listen for changes.
+
+        The first poll runs once the listener got its cursor, so it covers
+        every change before the cursor and the reset of the first call does
+        not poll all items a second time.
+        """
+        await self._async_listen()
+
+    async def _async_listen(self) -> None:
+        """Apply pushed state changes until the listener is not supported.
+
+        Failed connections are retried with a doubling delay. The listener
+        is given up if the controller does not implement the call or answers
+        it with LISTEN_MAX_ERRORS errors in a row. Without a listener the
+        first poll runs right away.
+        """
+        cursor: int | None = None
+        failures = 0
+        errors = 0
+        while True:
+            try:
+                cursor, states = await self.central_control.wait_for_changes(cursor)
+            except CentralControlNotSupportedError:
+                _LOGGER.debug("Listener not supported, polling only")
+                self._async_set_listening(False)
+                await self._async_refresh_first()
+                return
+            except CentralControlError as err:
+                self._async_set_listening(False)
+                await self._async_refresh_first()
+                cursor = None
+                if not isinstance(err, CentralControlConnectionError):
+                    errors += 1
+                    if errors >= LISTEN_MAX_ERRORS:
+                        _LOGGER.debug("Listener rejected, polling only: %s", err)
+                        return
+                delay = min(LISTEN_RETRY_DELAY * 2**failures, LISTEN_RETRY_DELAY_MAX)
+                failures += 1
+                _LOGGER.debug(
+                    "Listener failed, polling until it reconnects in %s s: %s",
+                    delay,
+                    err,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            failures = errors = 0
+            self._async_set_listening(True)
+            if states is None:
+                # Changes since the cursor are unknown, poll everything.
+                self._last_full_poll = 0.0
+                if self.data is None:
+                    await self.async_refresh()
+                else:
+                    await self.async_request_refresh()
+            elif states and self.data is not None:
+                self._async_apply_states(states)
+
+    async def _async_refresh_first(self) -> None:
+        """Fetch the first state if no poll succeeded yet."""
+        if self.data is None:
+            await self.async_refresh()
+
+    @callback
+    def _async_set_listening(self, listening: bool) -> None:
+        """Switch between push updates and polling."""
+        if listening == self.listening:
+            return
+        self.listening = listening
+        _LOGGER.debug("Listener %s", "connected" if listening else "disconnected")
+        if listening:
+            self.update_interval = LISTEN_SCAN_INTERVAL
+        elif self._moving or self._commanded_until:
+            self.update_interval = FAST_SCAN_INTERVAL
+        else:
+            self.update_interval = self.scan_interval
+        self._schedule_refresh()
+
+    @callback
+    def _async_apply_states(self, states: dict[int, dict[str, Any]]) -> None:
+        """Fan pushed states out to the entities of the changed items."""
+        subscribed = set(self.async_contexts())
+        states = {
+            item_id: state for item_id, state in states.items() if item_id in subscribed
+        }
+        changed = self._track_states(states)
+        if not changed:
+            return
+
+        # After a failed poll every entity has to become available again.
+        self._changed = changed if self.last_update_success else None
+        self.received = set(states)
+        # Unlike async_set_updated_data this keeps the safety poll scheduled.
+        self.data = {**self.data, **states}
+        self.last_update_success = True
+        self.last_exception = None
+        self.async_update_listeners()
+
+    def _track_states(self, states: dict[int, dict[str, Any]]) -> set[int]:
+        """Track moving items and return the items whose state changed."""
+        changed: set[int] = set()
+        for item_id, state in states.items():
+            if state.get("moving_up") or state.get("moving_down"):
+                self._moving.add(item_id)
+            else:
+                self._moving.discard(item_id)
+
+            compact = _compact_state(state)
+            if self._last_states.get(item_id) != compact:
+                self._last_states[item_id] = compact
+                changed.add(item_id)
+        return changed
+
+    def _clamp_scan_interval(self, seconds: float) -> timedelta:
+        """Return the scan interval bounded by the options."""
+        options = self.config_entry.options
+        return timedelta(
+            seconds=min(
+                max(
+                    seconds,
+                    options.get(CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN),
+                ),
+                options.get(CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX),
+            )
+        )
+
+    def _tune_scan_interval(self, items: int) -> None:
+        """Set the scan interval from the latency of a batch of items."""
+        seconds = self.central_control.latency.poll_interval(items)
+        if seconds is None:
+            return
+        scan_interval = self._clamp_scan_interval(seconds)
+        if scan_interval != self.scan_interval:
+            _LOGGER.debug("Scan interval of %s items: %s", items, scan_interval)
+            self.scan_interval = scan_interval
+
+    def _active_item_ids(self, subscribed: set[int]) -> set[int]:
+        """Return the subscribed items which are moving or were commanded."""
+        now = time.monotonic()
+        self._commanded_until = {
+            item_id: until
+            for item_id, until in self._commanded_until.items()
+            if until > now
+        }
+        return (self._moving | self._commanded_until.keys()) & subscribed
+
+    async def _async_update_data(self) -> dict[int, dict[str, Any]]:
+        """Fetch the state of all subscribed or only the active items.
+
+        Updates run one at a time, the items changed and received by an
+        update are only set once it completed.
+        """
+        async with self._refresh_lock:
+            try:
+                return await self._async_poll()
+            except UpdateFailed:
+                # A failed update makes every entity unavailable.
+                self._changed = None
+                raise
+
+    async def _async_poll(self) -> dict[int, dict[str, Any]]:
+        """Poll the subscribed or only the active items."""
+        previous_success = self.last_update_success and self.data is not None
+
+        subscribed = set(self.async_contexts())
+        if not subscribed:
+            self._changed = None
+            return {}
+
+        now = time.monotonic()
+        active = self._active_item_ids(subscribed)
+        full_poll = (
+            self.data is None
+            or not active
+            or now - self._last_full_poll >= self.scan_interval.total_seconds()
+        )
+
+        breaker_state = self.central_control.breaker_state
+        if breaker_state is BreakerState.OPEN:
+            raise UpdateFailed("Polling is paused after repeated failures")
+
+        # Listeners by item id, notified while the batch is streaming in.
+        dispatch = self._item_listeners if previous_success else {}
+
+        try:
+            if breaker_state is BreakerState.HALF_OPEN:
+                await self.central_control.async_probe(min(subscribed))
+            states = await self.central_control.get_states(
+                subscribed if full_poll else active,
+                on_state=partial(self._async_dispatch_state, dispatch),
+            )
+        except CentralControlError as err:
+            raise UpdateFailed(str(err)) from err
+        if not states:
+            raise UpdateFailed("No state received from the CentralControl")
+        _LOGGER.debug("Request limiter: %s", self.central_control.limiter_stats)
+
+        changed = self._track_states(states)
+        # Notify all entities unless the update succeeds after a success.
+        self._changed = changed if previous_success else None
+        self.received = set(states)
+        if full_poll:
+            self._tune_scan_interval(len(subscribed))
+
+        if self.listening:
+            self.update_interval = LISTEN_SCAN_INTERVAL
+        elif self._active_item_ids(subscribed):
+            self.update_interval = FAST_SCAN_INTERVAL
+        else:
+            self.update_interval = self.scan_interval
+
+        if full_poll:
+            self._last_full_poll = now
+            return states
+        return {**self.data, **states}
@@ -2,175 +2,176 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
-    CoverDeviceClass,
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_ID, CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-
-from .central_control import CentralControl
-from .const import BECKER_COVER_REVERSE_TYPES, COVER_MAPPING, DOMAIN, MANUFACTURER
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .central_control import CentralControl, CentralControlError
+from .const import (
+    CONF_AGGREGATES,
+    CONF_MEMBERS,
+    COVER_MAPPING,
+    DOMAIN,
+    MANUFACTURER,
+    MOTION_UPDATE_INTERVAL,
+)
+from .coordinator import CentralControlCoordinator
+from .models import BeckerItem, CentralControlConfigEntry, aggregate_unique_id
+from .motion import CoverMotion
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CentralControlConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Glue cover items to HASS entities."""
 
-    central_control: CentralControl = entry.runtime_data
-    try:
-        item_list = await central_control.get_item_list(item_type="group")
-        cover_list = []
-
-        for item in item_list.get("result", {}).get("item_list", []):
-            device_class = COVER_MAPPING.get(item.get("device_type"), None)
-            if device_class is not None:
-                cover_list.append(
-                    BeckerCover(
-                        central_control=central_control,
-                        item=item,
-                    )
-                )
+    coordinator = entry.runtime_data.coordinator
+    discovery = entry.runtime_data.discovery
+
+    async_add_entities(
+        BeckerCover(
+            coordinator=coordinator,
+            item=item,
+        )
+        for item in discovery.groups_of_types(COVER_MAPPING)
+    )
+
+    covers = {
+        item.id: item
+        for item in discovery.groups_of_types(COVER_MAPPING)
+        if item.feedback
+    }
+    async_add_entities(
+        BeckerAggregateCover(
+            coordinator=coordinator,
+            entry_id=entry.entry_id,
+            name=entry.title,
+            aggregate=aggregate,
+            members=members,
+        )
+        for aggregate in entry.options.get(CONF_AGGREGATES, [])
+        if (
+            members := [covers[id_] for id_ in aggregate[CONF_MEMBERS] if id_ in covers]
+        )
+    )
 
-        async_add_entities(cover_list)
-    except TimeoutError:
-        _LOGGER.error("Failed to get item list")
+
+def _is_closed(
+    item: BeckerItem, position: int | None, invert_position: bool
+) -> bool | None:
+    """Return if a cover at a position is closed, None if unknown."""
+    if item.backend == "centronic":
+        return None
+    if position == 0:
+        return not invert_position
+    if position == 100:
+        return invert_position
+    return None
 
 
-class BeckerCover(CoverEntity):
-    """Representation of a Becker cover."""
+class BeckerCover(CoordinatorEntity[CentralControlCoordinator], CoverEntity):
+    """Representation of a Becker cover.
+
+    While the cover moves its position is interpolated by a motion model
+    every MOTION_UPDATE_INTERVAL, polls correct it. Covers without feedback
+    get a position estimated from the commands sent to them.
+    """
 
     def __init__(
         self,
-        central_control,
-        item,
+        coordinator: CentralControlCoordinator,
+        item: BeckerItem,
     ) -> None:
         """Initialize the cover."""
-        self._central_control: CentralControl = central_control
+        # Only groups with the feedback flag report a state worth polling.
+        super().__init__(coordinator, context=item.id if item.feedback else None)
+        self._central_control: CentralControl = coordinator.central_control
         self._item = item
-
-        self._attr_name = f"{central_control.prefix}{item.get('name', 'Unknown')}"
-        self._attr_unique_id = f"{central_control.prefix}_{item.get('id')}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.unique_id)},
+        self._motion = CoverMotion()
+        self._unsub_motion: CALLBACK_TYPE | None = None
+        self._written_available: bool | None = None
+
+        self._attr_name = item.name
+        self._attr_unique_id = item.unique_id
+        self._attr_device_class = item.device_class
+        self._attr_supported_features = item.supported_features
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, item.unique_id)},
             manufacturer=MANUFACTURER,
-            name=self.name,
+            name=item.name,
         )
 
-    @property
-    def device_class(self) -> CoverDeviceClass | None:
-        """Return the class of this device, from component DEVICE_CLASSES."""
-        return COVER_MAPPING.get(self._item.get("device_type"))
-
-    @property
-    def is_opening(self) -> bool | None:
-        """Return if the cover is opening or not."""
-        return None
-
-    @property
-    def is_closing(self) -> bool | None:
-        """Return if the cover is closing or not."""
-        return None
-
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed."""
-        if self._item.get("backend") == "centronic":
-            return None
-        if self._attr_current_cover_position == 0:
-            if self._central_control.invert_position:
-                return False
-            return True
-        if self._attr_current_cover_position == 100:
-            if self._central_control.invert_position:
-                return True
-            return False
-        return None
-
-    @property
-    def unique_id(self) -> str:
-        """The items unique id."""
-        return str(self._item.get("id"))
-
-    @property
-    def name(self) -> str:
-        """The items name, "Unknown" if None."""
-        return f"{self._item.get('name', 'Unknown')}"
-
-    @property
-    def should_poll(self) -> bool:
-        """True if the item has the feedback flag."""
-        if self._item.get("feedback", False) is True:
-            return True
-        return False
-
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Flag supported features."""
-        _supported_features = (
-            CoverEntityFeature.OPEN | CoverEntityFeature.STOP | CoverEntityFeature.CLOSE
+        return _is_closed(
+            self._item,
+            self._attr_current_cover_position,
+            self._central_control.invert_position,
         )
-        if self._item.get("feedback") is True:
-            _supported_features |= CoverEntityFeature.SET_POSITION
-
-        return _supported_features
 
     @property
     def reversed(self) -> bool:
-        """Whether the conver is reversed (only awning)."""
-
-        # exlude awning from invert_position
-        if (
-            self._central_control.invert_position
-            and self._item.get("device_type") not in BECKER_COVER_REVERSE_TYPES
-        ):
-            return True
-
-        return self._item.get("device_type") in BECKER_COVER_REVERSE_TYPES
+        """Whether the cover is reversed (awnings or invert_position)."""
+        return self._item.reversed
+
+    async def _async_send_command(self, command: str, value) -> None:
+        """Send a command, estimate the move and poll the cover fast."""
+        try:
+            await self._central_control.group_send_command(
+                group_id=self._item.id,
+                command=command,
+                value=value,
+            )
+        except CentralControlError as err:
+            raise HomeAssistantError(
+                f"Failed to send {command} to {self.name}: {err}"
+            ) from err
+
+        now = time.monotonic()
+        if command == "move":
+            self._motion.command((value > 0) - (value < 0), now)
+        elif command == "moveto" and (current := self._motion.value(now)) is not None:
+            self._motion.command((value > current) - (value < current), now, value)
+        self._update_from_motion()
+        self.async_write_ha_state()
+
+        self.coordinator.async_mark_active(self._item.id)
+        await self.coordinator.async_request_refresh()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
         direction = -1 if self.reversed else 1
 
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="move",
-            value=direction,
-        )
+        await self._async_send_command(command="move", value=direction)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         direction = 1 if self.reversed else -1
 
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="move",
-            value=direction,
-        )
+        await self._async_send_command(command="move", value=direction)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="move",
-            value=0,
-        )
+        await self._async_send_command(command="move", value=0)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the covers position."""
@@ -179,21 +180,228 @@ class BeckerCover(CoverEntity):
         if not self.reversed:
             value = 100 - value
 
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="moveto",
-            value=value,
+        await self._async_send_command(command="moveto", value=value)
+
+    async def async_added_to_hass(self) -> None:
+        """Complete the initialization."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_stop_motion_updates)
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        Without feedback the entity is notified on every update, but only
+        its availability can change, so the state is only written then.
+        """
+        if not self._item.feedback and self.available == self._written_available:
+            return
+        self._written_available = self.available
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Correct the motion model with the coordinator data."""
+        if self.coordinator.data is None:
+            return
+        state = self.coordinator.data.get(self._item.id)
+        if state is None or state.get("value") is None:
+            return
+        # Moving down increases the value towards closed.
+        direction = bool(state.get("moving_down")) - bool(state.get("moving_up"))
+        self._motion.observe(float(state["value"]), direction, time.monotonic())
+        self._update_from_motion()
+
+    def _update_from_motion(self) -> None:
+        """Update position and motion from the motion model."""
+        now = time.monotonic()
+        if not self._item.feedback and self._motion.arrived(now):
+            self._motion.stop(now)
+
+        value = self._motion.value(now)
+        if value is not None:
+            value = round(value)
+            self._attr_current_cover_position = value if self.reversed else 100 - value
+
+        # Reversed covers open by moving down.
+        direction = self._motion.direction
+        self._attr_is_opening = direction > 0 if self.reversed else direction < 0
+        self._attr_is_closing = direction < 0 if self.reversed else direction > 0
+
+        if direction:
+            self._async_start_motion_updates()
+        else:
+            self._async_stop_motion_updates()
+
+    @callback
+    def _async_start_motion_updates(self) -> None:
+        """Write the interpolated position regularly while moving."""
+        if self._unsub_motion is None and self.hass is not None:
+            self._unsub_motion = async_track_time_interval(
+                self.hass, self._async_motion_update, MOTION_UPDATE_INTERVAL
+            )
+
+    @callback
+    def _async_stop_motion_updates(self) -> None:
+        """Stop writing the interpolated position."""
+        if self._unsub_motion is not None:
+            self._unsub_motion()
+            self._unsub_motion = None
+
+    @callback
+    def _async_motion_update(self, _now: datetime) -> None:
+        """Write the interpolated position."""
+        self._update_from_motion()
+        self.async_write_ha_state()
+
+
+class BeckerAggregateCover(CoordinatorEntity[CentralControlCoordinator], CoverEntity):
+    """Representation of covers with feedback aggregated in the options.
+
+    Position and motion are computed from the polled states of the members
+    without requests of their own, the position is the mean of the member
+    positions. The covers are closed once every member with a known state is
+    closed and open as soon as one member is open, members are judged like
+    single covers. Commands are sent to all members in one batch.
+    """
+
+    _attr_supported_features = (
+        CoverEntityFeature.OPEN
+        | CoverEntityFeature.STOP
+        | CoverEntityFeature.CLOSE
+        | CoverEntityFeature.SET_POSITION
+    )
+
+    def __init__(
+        self,
+        coordinator: CentralControlCoordinator,
+        entry_id: str,
+        name: str,
+        aggregate: dict[str, Any],
+        members: list[BeckerItem],
+    ) -> None:
+        """Initialize the cover."""
+        # Notified on every update to follow the availability, the members
+        # are subscribed in async_added_to_hass.
+        super().__init__(coordinator)
+        self._central_control: CentralControl = coordinator.central_control
+        self._members = members
+        self._written: tuple | None = None
+
+        self._attr_name = aggregate[CONF_NAME]
+        self._attr_unique_id = aggregate_unique_id(entry_id, aggregate[CONF_ID])
+        device_classes = {item.device_class for item in members}
+        if len(device_classes) == 1:
+            self._attr_device_class = device_classes.pop()
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer=MANUFACTURER,
+            name=name,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the state of a member is known."""
+        return super().available and self._attr_current_cover_position is not None
+
+    async def _async_send_commands(self, command: str, values: list[Any]) -> None:
+        """Send a command with a value per member and poll the members fast."""
+        try:
+            await self._central_control.group_send_commands(
+                (item.id, command, value)
+                for item, value in zip(self._members, values, strict=True)
+            )
+        except CentralControlError as err:
+            raise HomeAssistantError(
+                f"Failed to send {command} to {self.name}: {err}"
+            ) from err
+
+        for item in self._members:
+            self.coordinator.async_mark_active(item.id)
+        await self.coordinator.async_request_refresh()
+
+    async def async_close_cover(self, **kwargs: Any) -> None:
+        """Close the covers."""
+        await self._async_send_commands(
+            "move", [-1 if item.reversed else 1 for item in self._members]
+        )
+
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        """Open the covers."""
+        await self._async_send_commands(
+            "move", [1 if item.reversed else -1 for item in self._members]
+        )
+
+    async def async_stop_cover(self, **kwargs: Any) -> None:
+        """Stop the covers."""
+        await self._async_send_commands("move", [0] * len(self._members))
+
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
+        """Set the position of the covers."""
+        position = int(kwargs[ATTR_POSITION])
+        await self._async_send_commands(
+            "moveto",
+            [position if item.reversed else 100 - position for item in self._members],
         )
 
     async def async_added_to_hass(self) -> None:
         """Complete the initialization."""
-        await self.async_update()
-
-    async def async_update(self) -> None:
-        """Update brightness."""
-        state = await self._central_control.get_state(item_id=int(self.unique_id))
-        if state is not None and state.get("value", None) is not None:
-            if self.reversed:
-                self._attr_current_cover_position = int(state.get("value", "0"))
-            else:
-                self._attr_current_cover_position = 100 - int(state.get("value", "0"))
+        await super().async_added_to_hass()
+        for item in self._members:
+            self.async_on_remove(
+                self.coordinator.async_add_listener(
+                    self._handle_coordinator_update, item.id
+                )
+            )
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the members or the availability changed."""
+        self._update_from_coordinator()
+        written = (
+            self.available,
+            self._attr_current_cover_position,
+            self._attr_is_closed,
+            self._attr_is_opening,
+            self._attr_is_closing,
+        )
+        if written != self._written:
+            self._written = written
+            super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Aggregate the member states of the coordinator data."""
+        data = self.coordinator.data or {}
+        invert_position = self._central_control.invert_position
+        positions: list[float] = []
+        closed: set[bool | None] = set()
+        opening = closing = False
+        for item in self._members:
+            state = data.get(item.id)
+            if state is None or state.get("value") is None:
+                continue
+            value = float(state["value"])
+            position = value if item.reversed else 100 - value
+            positions.append(position)
+            closed.add(_is_closed(item, round(position), invert_position))
+            # Moving down closes the cover unless it is reversed.
+            direction = bool(state.get("moving_down")) - bool(state.get("moving_up"))
+            if item.reversed:
+                direction = -direction
+            opening |= direction < 0
+            closing |= direction > 0
+
+        if positions:
+            self._attr_current_cover_position = round(sum(positions) / len(positions))
+        else:
+            self._attr_current_cover_position = None
+        if False in closed:
+            self._attr_is_closed = False
+        elif closed == {True}:
+            self._attr_is_closed = True
+        else:
+            self._attr_is_closed = None
+        self._attr_is_opening = opening
+        self._attr_is_closing = closing
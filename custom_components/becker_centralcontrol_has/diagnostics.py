@@ -0,0 +1,61 @@
+"""Diagnostics support for the CentralControl integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .manager import DATA_MANAGER
+from .models import CentralControlConfigEntry
+
+TO_REDACT = {"gw_token", "host_address"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CentralControlConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    central_control = entry.runtime_data.central_control
+    coordinator = entry.runtime_data.coordinator
+    discovery = entry.runtime_data.discovery
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "discovery": {
+            "groups": {
+                device_type: len(items)
+                for device_type, items in discovery.groups.items()
+            },
+            "remotes": {
+                remote_type: len(items)
+                for remote_type, items in discovery.remotes.items()
+            },
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "skipped_writes": coordinator.skipped_writes,
+            "skipped_writes_total": coordinator.skipped_writes_total,
+            "unfiltered_listeners": coordinator.unfiltered_listeners,
+            "listening": coordinator.listening,
+            "scan_interval": coordinator.scan_interval.total_seconds(),
+        },
+        "central_control": {
+            "breaker": {
+                "state": central_control.breaker_state,
+                "failures": central_control.breaker_failures,
+            },
+            "limiter": central_control.limiter_stats,
+            "metrics": central_control.metrics.as_dict(),
+            "latency": central_control.latency.as_dict(),
+        },
+        "fleet": hass.data[DATA_MANAGER].as_dict(),
+    }
@@ -0,0 +1,174 @@
+"""Item discovery for the CentralControl integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .central_control import CentralControl, CentralControlError
+from .const import DOMAIN
+from .models import BeckerItem
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+@dataclass
+class CentralControlDiscovery:
+    """Inventory of a CentralControl, shared by all platforms.
+
+    groups -- group items by device_type
+    remotes -- remote items by remote_type
+    members -- member group ids of parent groups
+    item_lists -- the item lists as returned by the CentralControl
+    """
+
+    groups: dict[str, list[BeckerItem]] = field(default_factory=dict)
+    remotes: dict[str, list[BeckerItem]] = field(default_factory=dict)
+    members: dict[int, list[int]] = field(default_factory=dict)
+    item_lists: dict[str, list[dict[str, Any]]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_item_lists(
+        cls,
+        groups: list[dict[str, Any]],
+        remotes: list[dict[str, Any]],
+        invert_position: bool = False,
+        members: dict[int, list[int]] | None = None,
+    ) -> CentralControlDiscovery:
+        """Parse the group and remote lists of the CentralControl."""
+        members = members or {}
+        return cls(
+            groups=_by_type(groups, "device_type", invert_position),
+            remotes=_by_type(remotes, "remote_type", invert_position),
+            members=members,
+            item_lists={
+                "groups": groups,
+                "remotes": remotes,
+                # JSON object keys are strings.
+                "members": {str(parent): ids for parent, ids in members.items()},
+            },
+        )
+
+    @property
+    def item_ids(self) -> set[int]:
+        """Return the ids of all groups and remotes."""
+        return set(self.item_types)
+
+    @property
+    def item_types(self) -> dict[int, str | None]:
+        """Return the item type of all groups and remotes by id."""
+        return {
+            item.id: item.item_type
+            for items in (*self.groups.values(), *self.remotes.values())
+            for item in items
+        }
+
+    def groups_of_types(self, device_types: Iterable[str]) -> list[BeckerItem]:
+        """Return all groups with one of the given device types."""
+        return [
+            item
+            for device_type in device_types
+            for item in self.groups.get(device_type, [])
+        ]
+
+    def remotes_of_types(self, remote_types: Iterable[str]) -> list[BeckerItem]:
+        """Return all remotes with one of the given remote types."""
+        return [
+            item
+            for remote_type in remote_types
+            for item in self.remotes.get(remote_type, [])
+        ]
+
+
+def _by_type(
+    items: list[dict[str, Any]], key: str, invert_position: bool
+) -> dict[str, list[BeckerItem]]:
+    """Parse items and group them by the value of the given key."""
+    result: dict[str, list[BeckerItem]] = {}
+    for item in items:
+        result.setdefault(item.get(key), []).append(
+            BeckerItem.from_dict(item, invert_position)
+        )
+    return result
+
+
+async def async_discover(
+    central_control: CentralControl,
+) -> CentralControlDiscovery | None:
+    """Fetch the groups and remotes of the CentralControl.
+
+    The member groups of all groups are fetched afterwards to find the
+    parent groups. If that fails discovery continues without them, commands
+    are then not collapsed into parent groups.
+
+    Returns None if the response contains no group list. Raises
+    CentralControlError if the CentralControl could not be reached.
+    """
+    group_list, remote_list = await asyncio.gather(
+        central_control.get_item_list(item_type="group"),
+        central_control.get_item_list(item_type="remote"),
+    )
+
+    groups = group_list.get("result", {}).get("item_list")
+    if groups is None:
+        return None
+    remotes = remote_list.get("result", {}).get("item_list") or []
+    try:
+        members = await central_control.get_group_members(
+            int(group["id"]) for group in groups if "id" in group
+        )
+    except CentralControlError as err:
+        _LOGGER.warning(
+            "Failed to look up the parent groups of %s: %s",
+            central_control.address,
+            err,
+        )
+        members = {}
+
+    return CentralControlDiscovery.from_item_lists(
+        groups, remotes, central_control.invert_position, members
+    )
+
+
+def _store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, list[dict[str, Any]]]]:
+    """Return the store of the discovery snapshot of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.discovery")
+
+
+async def async_load_snapshot(
+    hass: HomeAssistant, entry_id: str, invert_position: bool = False
+) -> CentralControlDiscovery | None:
+    """Return the last successful discovery of an entry, None if there is none."""
+    item_lists = await _store(hass, entry_id).async_load()
+    if not item_lists or item_lists.get("groups") is None:
+        return None
+    return CentralControlDiscovery.from_item_lists(
+        item_lists["groups"],
+        item_lists.get("remotes") or [],
+        invert_position,
+        {int(parent): ids for parent, ids in (item_lists.get("members") or {}).items()},
+    )
+
+
+async def async_save_snapshot(
+    hass: HomeAssistant, entry_id: str, discovery: CentralControlDiscovery
+) -> None:
+    """Persist a successful discovery of an entry."""
+    await _store(hass, entry_id).async_save(discovery.item_lists)
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the discovery snapshot of a removed entry."""
+    await _store(hass, entry_id).async_remove()
@@ -6,124 +6,115 @@ import logging
 from typing import Any
 
 from homeassistant.components.light import ColorMode, LightEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .central_control import CentralControl
-from .const import BECKER_LIGHT_TYPES, DOMAIN, MANUFACTURER
+from .central_control import CentralControl, CentralControlError
+from .const import BECKER_LIGHT_TYPES, DEVICE_TYPES, DOMAIN, MANUFACTURER
+from .coordinator import CentralControlCoordinator
+from .models import BeckerItem, CentralControlConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CentralControlConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Glue light items to HASS entities."""
 
-    central_control: CentralControl = entry.runtime_data
-    try:
-        item_list = await central_control.get_item_list(item_type="group")
-        light_list = []
+    coordinator = entry.runtime_data.coordinator
+    discovery = entry.runtime_data.discovery
 
-        for item in item_list.get("result", {}).get("item_list", []):
-            device_class = item.get("device_type") in BECKER_LIGHT_TYPES
-            if device_class is not False:
-                light_list.append(
-                    BeckerLight(
-                        central_control=central_control,
-                        item=item,
-                    )
-                )
-
-        async_add_entities(light_list)
-    except TimeoutError:
-        _LOGGER.error("Failed to get item list")
-        return
+    async_add_entities(
+        BeckerLight(
+            coordinator=coordinator,
+            item=item,
+        )
+        for item in discovery.groups_of_types(BECKER_LIGHT_TYPES)
+    )
 
 
-class BeckerLight(LightEntity):
+class BeckerLight(CoordinatorEntity[CentralControlCoordinator], LightEntity):
     """Representation of a Becker light."""
 
     def __init__(
         self,
-        central_control,
-        item,
+        coordinator: CentralControlCoordinator,
+        item: BeckerItem,
     ) -> None:
         """Initialize the light."""
-        self._central_control: CentralControl = central_control
+        # Only groups with the feedback flag report a state worth polling.
+        super().__init__(coordinator, context=item.id if item.feedback else None)
+        self._central_control: CentralControl = coordinator.central_control
         self._item = item
+        self._written_available: bool | None = None
 
-        self._attr_name = f"{central_control.prefix}{item.get('name', 'Unknown')}"
-        self._attr_unique_id = f"{central_control.prefix}_{item.get('id')}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.unique_id)},
+        self._attr_name = item.name
+        self._attr_unique_id = item.unique_id
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, item.unique_id)},
             manufacturer=MANUFACTURER,
-            name=self.name,
+            name=item.name,
         )
-
-    @property
-    def unique_id(self) -> str:
-        """The items unique id."""
-        return str(self._item.get("id"))
-
-    @property
-    def name(self) -> str:
-        """The items name, "Unknown" if None."""
-        return self._item.get("name", "Unknown")
-
-    @property
-    def should_poll(self) -> bool:
-        """True if the item has the feedback flag."""
-        if self._item.get("feedback", False) is True:
-            return True
-        return False
-
-    @property
-    def color_mode(self) -> ColorMode | str | None:
-        """Flag supported color mode."""
-        if self._item.get("device_type") == "dimmer":
-            return ColorMode.BRIGHTNESS
-        return ColorMode.ONOFF
-
-    @property
-    def supported_color_modes(self) -> set[str]:
-        """Flag supported color mode."""
-        if self._item.get("device_type") == "dimmer":
-            return {ColorMode.BRIGHTNESS}
-        return {ColorMode.ONOFF}
+        color_mode = (
+            ColorMode.BRIGHTNESS
+            if item.device_type == DEVICE_TYPES.DIMMER
+            else ColorMode.ONOFF
+        )
+        self._attr_color_mode = color_mode
+        self._attr_supported_color_modes = {color_mode}
+
+    async def _async_send_command(self, command: str, value) -> None:
+        """Send a command and poll the light fast for a while."""
+        try:
+            await self._central_control.group_send_command(
+                group_id=self._item.id,
+                command=command,
+                value=value,
+            )
+        except CentralControlError as err:
+            raise HomeAssistantError(
+                f"Failed to send {command} to {self.name}: {err}"
+            ) from err
+        self.coordinator.async_mark_active(self._item.id)
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="switch",
-            value=1,
-        )
+        await self._async_send_command(command="switch", value=1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the the light off."""
-        await self._central_control.group_send_command(
-            group_id=int(self.unique_id),
-            command="switch",
-            value=0,
-        )
+        await self._async_send_command(command="switch", value=0)
 
     async def async_added_to_hass(self) -> None:
         """Complete the initialization."""
-        await self.async_update()
-
-    async def async_update(self) -> None:
-        """Update brightness."""
-        state = await self._central_control.get_state(item_id=int(self.unique_id))
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        Without feedback the entity is notified on every update, but only
+        its availability can change, so the state is only written then.
+        """
+        if not self._item.feedback and self.available == self._written_available:
+            return
+        self._written_available = self.available
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Update brightness from the coordinator data."""
+        if self.coordinator.data is None:
+            return
+        state = self.coordinator.data.get(self._item.id, {})
         if state.get("value", None) is not None:
             self._attr_is_on = bool(state.get("value"))
             self._attr_brightness = int(state.get("value"))
-            _LOGGER.log(logging.INFO, state)
@@ -0,0 +1,100 @@
+"""Priority aware limiter for concurrent CentralControl requests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class RequestLimiter:
+    """Limit the number of requests in flight.
+
+    Waiting requests are served by priority (lower first) and in arrival
+    order within a priority, so commands overtake queued state polls.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Init.
+
+        limit -- maximum number of concurrent requests
+        """
+
+        self._limit = max(1, limit)
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+        self._acquired = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_last = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Return usage and wait time statistics."""
+
+        return {
+            "limit": self._limit,
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "acquired": self._acquired,
+            "wait_last": self._wait_last,
+            "wait_max": self._wait_max,
+            "wait_avg": self._wait_total / self._acquired if self._acquired else 0.0,
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the context."""
+
+        start = time.monotonic()
+        await self._acquire(priority)
+
+        waited = time.monotonic() - start
+        self._acquired += 1
+        self._wait_total += waited
+        self._wait_last = waited
+        self._wait_max = max(self._wait_max, waited)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until a slot is free."""
+
+        if self._active < self._limit and not self.queue_depth:
+            self._active += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot over to the next waiter or free it."""
+
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
@@ -0,0 +1,128 @@
+"""Manager of all CentralControls set up in Home Assistant."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .limiter import RequestLimiter
+from .metrics import MethodMetrics
+
+if TYPE_CHECKING:
+    from .coordinator import CentralControlCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_MANAGER: HassKey[CentralControlManager] = HassKey(DOMAIN)
+
+# Requests in flight to all CentralControls together.
+FLEET_MAX_CONCURRENT_REQUESTS = 8
+# Spreads poll offsets evenly for any number of controllers.
+_GOLDEN_RATIO = 0.6180339887498949
+
+
+class CentralControlManager:
+    """Share a connection pool and a request budget between CentralControls.
+
+    Every coordinator is assigned a slot, the first poll after setup of the
+    n-th slot is delayed by a fraction of the poll interval so the poll
+    cycles of the controllers do not fire on the same tick. The fractions
+    are spread by the golden ratio so they stay apart as controllers come
+    and go without moving the others.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass = hass
+        self.limiter = RequestLimiter(FLEET_MAX_CONCURRENT_REQUESTS)
+        self._session: aiohttp.ClientSession | None = None
+        self._coordinators: dict[int, CentralControlCoordinator] = {}
+        self._started = time.monotonic()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session shared by all CentralControls."""
+
+        if self._session is None:
+            self._session = async_create_clientsession(self.hass)
+        return self._session
+
+    @callback
+    def async_register(
+        self, coordinator: CentralControlCoordinator
+    ) -> Callable[[], None]:
+        """Add a coordinator to the fleet and stagger its polls.
+
+        Returns a callback removing the coordinator again.
+        """
+
+        slot = next(
+            slot
+            for slot in range(len(self._coordinators) + 1)
+            if slot not in self._coordinators
+        )
+        self._coordinators[slot] = coordinator
+
+        offset = 0.0
+        if slot and coordinator.update_interval is not None:
+            offset = (
+                slot * _GOLDEN_RATIO % 1 * coordinator.update_interval.total_seconds()
+            )
+        _LOGGER.debug("Polls of %s are offset by %.1f s", coordinator.name, offset)
+
+        cancel_stagger: Callable[[], None] | None = None
+        if offset:
+
+            @callback
+            def _async_stagger(_now: Any) -> None:
+                """Move the poll cycle of the coordinator by its offset.
+
+                Skipped while the first refresh is still running or the
+                listener pushes the changes.
+                """
+                nonlocal cancel_stagger
+                cancel_stagger = None
+                if coordinator.data is None or coordinator.listening:
+                    return
+                coordinator.config_entry.async_create_background_task(
+                    self.hass,
+                    coordinator.async_request_refresh(),
+                    f"{DOMAIN} staggered refresh {coordinator.name}",
+                )
+
+            cancel_stagger = async_call_later(self.hass, offset, _async_stagger)
+
+        @callback
+        def _async_unregister() -> None:
+            """Remove the coordinator from the fleet."""
+            if cancel_stagger is not None:
+                cancel_stagger()
+            self._coordinators.pop(slot, None)
+
+        return _async_unregister
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate throughput and latency of all CentralControls."""
+
+        total = MethodMetrics.merged(
+            coordinator.central_control.metrics.total
+            for coordinator in self._coordinators.values()
+        )
+        uptime = time.monotonic() - self._started
+        return {
+            "controllers": len(self._coordinators),
+            "limiter": self.limiter.stats,
+            "requests_per_second": total.requests / uptime if uptime else 0.0,
+            "metrics": total.as_dict(),
+        }
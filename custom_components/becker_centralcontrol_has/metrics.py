@@ -0,0 +1,148 @@
+"""Request metrics of the CentralControl client."""
+
+from collections import deque
+from collections.abc import Iterable
+import itertools
+
+# Number of latency samples kept per method for the percentiles.
+LATENCY_SAMPLES = 512
+
+
+class MethodMetrics:
+    """Counters and recent latencies of one JSON-RPC method."""
+
+    __slots__ = (
+        "_latencies",
+        "bytes_received",
+        "bytes_sent",
+        "calls",
+        "errors",
+        "requests",
+        "timeouts",
+    )
+
+    def __init__(self, samples: int = LATENCY_SAMPLES) -> None:
+        """Init.
+
+        samples -- number of latency samples kept for the percentiles
+        """
+
+        self.requests = 0
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._latencies: deque[float] = deque(maxlen=samples)
+
+    @classmethod
+    def merged(cls, metrics: Iterable["MethodMetrics"]) -> "MethodMetrics":
+        """Return the sum of several metrics, keeping all latency samples."""
+
+        metrics = list(metrics)
+        result = cls(samples=LATENCY_SAMPLES * max(1, len(metrics)))
+        for other in metrics:
+            result.requests += other.requests
+            result.calls += other.calls
+            result.errors += other.errors
+            result.timeouts += other.timeouts
+            result.bytes_sent += other.bytes_sent
+            result.bytes_received += other.bytes_received
+        result._latencies.extend(
+            itertools.chain.from_iterable(other._latencies for other in metrics)
+        )
+        return result
+
+    def add_latency(self, latency: float) -> None:
+        """Add a latency sample in seconds."""
+
+        self._latencies.append(latency)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the latency percentile in seconds, None without samples."""
+
+        if not self._latencies:
+            return None
+        samples = sorted(self._latencies)
+        index = min(len(samples) - 1, max(0, round(percent / 100 * len(samples)) - 1))
+        return samples[index]
+
+    def as_dict(self) -> dict[str, int | float | None]:
+        """Return the metrics as dict."""
+
+        return {
+            "requests": self.requests,
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_p50": self.percentile(50),
+            "latency_p95": self.percentile(95),
+            "latency_p99": self.percentile(99),
+        }
+
+
+class RequestMetrics:
+    """Metrics of all requests, per JSON-RPC method and in total.
+
+    Batches of a single method are counted under that method, mixed batches
+    under the sorted method names joined with "+".
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.total = MethodMetrics()
+        self._methods: dict[str, MethodMetrics] = {}
+
+    @staticmethod
+    def method_key(data: dict | list[dict]) -> str:
+        """Return the key a request is counted under."""
+
+        if isinstance(data, dict):
+            return str(data.get("method"))
+        return "+".join(sorted({str(call.get("method")) for call in data}))
+
+    def _record(self, method: str, calls: int, bytes_sent: int) -> list[MethodMetrics]:
+        """Count a request and return the metrics it was counted in."""
+
+        targets = [self.total, self._methods.setdefault(method, MethodMetrics())]
+        for metrics in targets:
+            metrics.requests += 1
+            metrics.calls += calls
+            metrics.bytes_sent += bytes_sent
+        return targets
+
+    def record_success(
+        self,
+        method: str,
+        calls: int,
+        latency: float | None,
+        bytes_sent: int,
+        bytes_received: int,
+    ) -> None:
+        """Record a completed request, long polls are recorded without latency."""
+
+        for metrics in self._record(method, calls, bytes_sent):
+            metrics.bytes_received += bytes_received
+            if latency is not None:
+                metrics.add_latency(latency)
+
+    def record_failure(
+        self, method: str, calls: int, bytes_sent: int, timeout: bool
+    ) -> None:
+        """Record a failed request."""
+
+        for metrics in self._record(method, calls, bytes_sent):
+            metrics.errors += 1
+            if timeout:
+                metrics.timeouts += 1
+
+    def as_dict(self) -> dict[str, dict[str, int | float | None]]:
+        """Return the metrics per method and in total."""
+
+        return {
+            "total": self.total.as_dict(),
+            **{method: metrics.as_dict() for method, metrics in self._methods.items()},
+        }
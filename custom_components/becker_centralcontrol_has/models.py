@@ -0,0 +1,83 @@
+"""Data models for the CentralControl integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from homeassistant.components.cover import CoverDeviceClass, CoverEntityFeature
+from homeassistant.config_entries import ConfigEntry
+
+from .const import BECKER_COVER_REVERSE_TYPES, COVER_MAPPING
+
+if TYPE_CHECKING:
+    from .central_control import CentralControl
+    from .coordinator import CentralControlCoordinator
+    from .discovery import CentralControlDiscovery
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BeckerItem:
+    """Parsed item of the CentralControl item list.
+
+    Built once at discovery and shared by all platforms, the values read on
+    every state write are precomputed.
+    """
+
+    id: int
+    unique_id: str
+    name: str
+    item_type: str | None
+    device_type: str | None
+    remote_type: str | None
+    feedback: bool
+    backend: str | None
+    device_class: CoverDeviceClass | None
+    reversed: bool
+    supported_features: CoverEntityFeature
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any], invert_position: bool = False) -> Self:
+        """Parse an entry of deviced.deviced_get_item_list."""
+        device_type = item.get("device_type")
+        feedback = item.get("feedback") is True
+
+        supported_features = (
+            CoverEntityFeature.OPEN | CoverEntityFeature.STOP | CoverEntityFeature.CLOSE
+        )
+        if feedback:
+            supported_features |= CoverEntityFeature.SET_POSITION
+
+        # Awnings are always reversed, invert_position reverses everything else.
+        reversed_ = invert_position or device_type in BECKER_COVER_REVERSE_TYPES
+
+        return cls(
+            id=int(item["id"]),
+            unique_id=str(item["id"]),
+            name=item.get("name", "Unknown"),
+            item_type=item.get("item_type"),
+            device_type=device_type,
+            remote_type=item.get("remote_type"),
+            feedback=feedback,
+            backend=item.get("backend"),
+            device_class=COVER_MAPPING.get(device_type),
+            reversed=reversed_,
+            supported_features=supported_features,
+        )
+
+
+def aggregate_unique_id(entry_id: str, aggregate_id: str) -> str:
+    """Return the unique id of an aggregate cover."""
+    return f"{entry_id}_aggregate_{aggregate_id}"
+
+
+@dataclass
+class CentralControlData:
+    """Runtime data of a CentralControl config entry."""
+
+    central_control: CentralControl
+    coordinator: CentralControlCoordinator
+    discovery: CentralControlDiscovery
+
+
+type CentralControlConfigEntry = ConfigEntry[CentralControlData]
@@ -0,0 +1,118 @@
+"""Motion model estimating cover values between polls."""
+
+# Seconds a cover is assumed to need for a full travel until one was measured.
+DEFAULT_TRAVEL_TIME = 30.0
+MIN_TRAVEL_TIME = 3.0
+MAX_TRAVEL_TIME = 180.0
+# Weight of a new measurement in the learned travel time.
+TRAVEL_TIME_SMOOTHING = 0.3
+# A measurement needs at least this many seconds and value steps of travel.
+MIN_SAMPLE_TIME = 2.0
+MIN_SAMPLE_DISTANCE = 5.0
+
+
+class CoverMotion:
+    """Estimate the value of a moving cover from its learned travel time.
+
+    Values are in the range of the CentralControl, 0 is open and 100 is
+    closed. A direction of 1 moves towards 100 (moving_down), -1 towards 0
+    (moving_up). Polled states correct the estimate and, while the cover
+    keeps moving, measure the time a full travel takes.
+    """
+
+    __slots__ = ("_direction", "_sample", "_target", "_time", "_value", "travel_time")
+
+    def __init__(self, travel_time: float = DEFAULT_TRAVEL_TIME) -> None:
+        """Init.
+
+        travel_time -- seconds of a full travel assumed until one was measured
+        """
+
+        self.travel_time = travel_time
+        self._value: float | None = None
+        self._time = 0.0
+        self._direction = 0
+        self._target: float | None = None
+        # Time and value at the start of the current measurement.
+        self._sample: tuple[float, float] | None = None
+
+    @property
+    def direction(self) -> int:
+        """Return the direction of the current move, 0 if stopped."""
+
+        return self._direction
+
+    def value(self, now: float) -> float | None:
+        """Return the estimated value, None if it was never known."""
+
+        if self._value is None or not self._direction:
+            return self._value
+
+        value = self._value + self._direction * 100 / self.travel_time * (
+            now - self._time
+        )
+        if self._direction > 0:
+            return min(value, 100.0 if self._target is None else self._target)
+        return max(value, 0.0 if self._target is None else self._target)
+
+    def arrived(self, now: float) -> bool:
+        """Return if an estimated move reached its end."""
+
+        if not self._direction:
+            return False
+        end = self._target
+        if end is None:
+            end = 100.0 if self._direction > 0 else 0.0
+        return self.value(now) == end
+
+    def observe(self, value: float, direction: int, now: float) -> None:
+        """Correct the estimate with a polled value and direction."""
+
+        if direction and direction == self._direction and self._sample is not None:
+            start_time, start_value = self._sample
+            elapsed = now - start_time
+            distance = abs(value - start_value)
+            if elapsed >= MIN_SAMPLE_TIME and distance >= MIN_SAMPLE_DISTANCE:
+                measured = min(
+                    MAX_TRAVEL_TIME, max(MIN_TRAVEL_TIME, 100 * elapsed / distance)
+                )
+                self.travel_time += TRAVEL_TIME_SMOOTHING * (
+                    measured - self.travel_time
+                )
+                self._sample = (now, value)
+        elif direction:
+            self._sample = (now, value)
+        else:
+            self._sample = None
+
+        if direction != self._direction:
+            self._target = None
+        self._value = value
+        self._time = now
+        self._direction = direction
+
+    def command(self, direction: int, now: float, target: float | None = None) -> None:
+        """Start or stop an estimated move after a command was sent.
+
+        direction -- 1 to close, -1 to open, 0 to stop
+        target -- value the move stops at, the end of travel if None
+
+        Without a known value a move is assumed to start at the opposite end.
+        """
+
+        value = self.value(now)
+        if value is None:
+            if not direction:
+                return
+            value = 0.0 if direction > 0 else 100.0
+
+        self._value = value
+        self._time = now
+        self._direction = direction
+        self._target = target
+        self._sample = None
+
+    def stop(self, now: float) -> None:
+        """Stop an estimated move at its current value."""
+
+        self.command(0, now)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any, cast
 
 from homeassistant.components.sensor import (
@@ -13,51 +15,70 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .central_control import CentralControl
-from .const import DOMAIN, MANUFACTURER, REMOTE_SUPPORTED_VALUES, REMOTE_TYPES
+from .const import (
+    CONF_DEADBAND,
+    CONF_HEARTBEAT,
+    CONF_MIN_INTERVAL,
+    DOMAIN,
+    MANUFACTURER,
+    REMOTE_SUPPORTED_VALUES,
+    REMOTE_TYPES,
+    STATS_CAPACITY,
+    STATS_WINDOW,
+)
+from .coordinator import CentralControlCoordinator
+from .metrics import MethodMetrics
+from .models import BeckerItem, CentralControlConfigEntry
+from .stats import RollingWindow
+from .throttle import PublishThrottle
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interval the request metric sensors are updated at.
+SCAN_INTERVAL = timedelta(seconds=60)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CentralControlConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Glue light items to HASS entities."""
-
-    central_control: CentralControl = entry.runtime_data
-    try:
-        item_list = await central_control.get_item_list(item_type="remote")
-        sensor_list: list[BeckerSensor] = []
+    """Glue sensor items to HASS entities."""
 
-        for item in item_list.get("result", {}).get("item_list", []):
-            remote_type = item.get("remote_type") in REMOTE_TYPES
+    coordinator = entry.runtime_data.coordinator
+    discovery = entry.runtime_data.discovery
 
-            if remote_type is not False:
-                supported_values = REMOTE_SUPPORTED_VALUES.get(
-                    item.get("remote_type", ""), []
-                )
-
-                sensor_list.extend(
-                    BeckerSensor(
-                        central_control=central_control,
-                        item=item,
-                        value_type=value_type,
-                    )
-                    for value_type in supported_values
-                )
-
-        async_add_entities(sensor_list)
-    except TimeoutError:
-        _LOGGER.error("Failed to get item list")
-        return
+    async_add_entities(
+        BeckerSensor(
+            coordinator=coordinator,
+            item=item,
+            value_type=value_type,
+        )
+        for item in discovery.remotes_of_types(REMOTE_TYPES)
+        for value_type in REMOTE_SUPPORTED_VALUES.get(item.remote_type, [])
+    )
+    async_add_entities(
+        CentralControlMetricSensor(
+            central_control=entry.runtime_data.central_control,
+            entry_id=entry.entry_id,
+            name=entry.title,
+            description=description,
+        )
+        for description in METRIC_SENSORS
+    )
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -67,27 +88,119 @@ class CentralControlSensorDescription(SensorEntityDescription):
     value_fn: Callable[[dict[str, Any]], str | int | float | None]
 
 
-class BeckerSensor(SensorEntity):
-    """Representation of a sensor."""
+@dataclass(frozen=True, kw_only=True)
+class CentralControlMetricDescription(SensorEntityDescription):
+    """Describes a request metric sensor of the CentralControl."""
+
+    value_fn: Callable[[MethodMetrics], int | float | None]
+
+
+def _latency_ms(percent: float) -> Callable[[MethodMetrics], float | None]:
+    """Return a function reading a latency percentile in milliseconds."""
+
+    def _value(metrics: MethodMetrics) -> float | None:
+        latency = metrics.percentile(percent)
+        return None if latency is None else round(latency * 1000, 1)
+
+    return _value
+
+
+METRIC_SENSORS: tuple[CentralControlMetricDescription, ...] = (
+    CentralControlMetricDescription(
+        key="requests",
+        translation_key="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.calls,
+    ),
+    CentralControlMetricDescription(
+        key="request_errors",
+        translation_key="request_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.errors,
+    ),
+    CentralControlMetricDescription(
+        key="request_timeouts",
+        translation_key="request_timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.timeouts,
+    ),
+    CentralControlMetricDescription(
+        key="bytes_sent",
+        translation_key="bytes_sent",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.bytes_sent,
+    ),
+    CentralControlMetricDescription(
+        key="bytes_received",
+        translation_key="bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.bytes_received,
+    ),
+    *(
+        CentralControlMetricDescription(
+            key=f"latency_p{percent}",
+            translation_key=f"latency_p{percent}",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=_latency_ms(percent),
+        )
+        for percent in (50, 95, 99)
+    ),
+)
+
+
+class BeckerSensor(CoordinatorEntity[CentralControlCoordinator], SensorEntity):
+    """Representation of a sensor.
+
+    Values are published through a throttle configured per value type in
+    the options, availability changes are always written right away.
+    Measurements carry the maximum, mean and gust of the readings received
+    within the statistics window as attributes. Readings are sampled on every
+    update, the attributes are written with the throttled state, so a
+    heartbeat bounds how long they can lag behind the window.
+    """
 
     _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset({"max", "mean", "gust"})
     entity_description: CentralControlSensorDescription
 
     def __init__(
         self,
-        central_control,
-        item,
+        coordinator: CentralControlCoordinator,
+        item: BeckerItem,
         value_type,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator, context=item.id)
+        central_control = coordinator.central_control
         self._central_control: CentralControl = central_control
-        self._attr_unique_id = f"{item['id']}-{value_type}"
         self._item = item
 
-        self._attr_name = f"{central_control.prefix}{item.get('name', 'Unknown')}"
-        self._attr_unique_id = f"{central_control.prefix}_{item.get('id')}_{value_type}"
+        self._attr_name = f"{central_control.prefix}{item.name}"
+        self._attr_unique_id = f"{central_control.prefix}_{item.id}_{value_type}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, item.id)},
+            manufacturer=MANUFACTURER,
+            name=item.name,
+        )
 
         self._value_type = value_type
+        settings = coordinator.config_entry.options.get(value_type, {})
+        self._throttle = PublishThrottle(
+            deadband=settings.get(CONF_DEADBAND, 0.0),
+            min_interval=settings.get(CONF_MIN_INTERVAL, 0),
+            heartbeat=settings.get(CONF_HEARTBEAT, 0),
+        )
+        self._pending: float | None = None
+        self._published_available: bool | None = None
+        self._unsub_publish: CALLBACK_TYPE | None = None
 
         if value_type is REMOTE_SUPPORTED_VALUES[REMOTE_TYPES.TEMPERATURE][0]:
             self.entity_description = CentralControlSensorDescription(
@@ -136,14 +249,9 @@ class BeckerSensor(SensorEntity):
                 state_class=SensorStateClass.MEASUREMENT,
             )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._item.get("id"))},
-            manufacturer=MANUFACTURER,
-            name=self._item.get("name"),
-        )
+        self._window: RollingWindow | None = None
+        if self.entity_description.state_class is SensorStateClass.MEASUREMENT:
+            self._window = RollingWindow(STATS_WINDOW.total_seconds(), STATS_CAPACITY)
 
     @property
     def native_value(self) -> str | int | float | None:
@@ -154,11 +262,136 @@ class BeckerSensor(SensorEntity):
 
         return self.entity_description.value_fn(self._attr_native_value)
 
-    async def async_update(self) -> None:
-        """Update brightness."""
+    async def async_added_to_hass(self) -> None:
+        """Complete the initialization."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_publish)
+        if self._window is not None:
+            # Readings are sampled on every update, the entity itself is
+            # only notified when its state changed.
+            self.async_on_remove(
+                self.coordinator.async_add_listener(self._async_record_sample)
+            )
+            self._async_record_sample()
+        self._update_from_coordinator()
+        if self._pending is not None:
+            self._attr_native_value = self._pending
+            self._throttle.publish(self._pending, time.monotonic())
+        self._update_statistics()
+        self._published_available = self.available
 
-        state = await self._central_control.get_state(item_id=int(self._item.get("id")))
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        if self.available != self._published_available:
+            self._async_publish()
+        else:
+            self._async_schedule_publish()
+
+    def _update_from_coordinator(self) -> None:
+        """Update the pending value from the coordinator data."""
+
+        if self.coordinator.data is None:
+            return
+        state = self.coordinator.data.get(self._item.id, {})
         value = state.get(f"value-{self._value_type}")
         if value is not None:
-            self._attr_native_value = round(state.get(f"value-{self._value_type}"), 1)
+            self._pending = round(value, 1)
             # self._attr_extra_state_attributes = {"rain": bool(self._attr_native_value)}
+
+    @callback
+    def _async_record_sample(self) -> None:
+        """Add the reading received by the last update to the window."""
+
+        if (
+            not self.coordinator.last_update_success
+            or self.coordinator.data is None
+            or self._item.id not in self.coordinator.received
+        ):
+            return
+        state = self.coordinator.data.get(self._item.id, {})
+        value = state.get(f"value-{self._value_type}")
+        if value is not None:
+            self._window.add(value, time.monotonic())
+
+    def _update_statistics(self) -> None:
+        """Update the attributes from the readings in the window."""
+
+        if self._window is not None:
+            self._attr_extra_state_attributes = self._window.stats(time.monotonic())
+
+    @callback
+    def _async_schedule_publish(self) -> None:
+        """Publish the pending value now or once the throttle allows it."""
+        self._async_cancel_publish()
+        if self._pending is None:
+            return
+        delay = self._throttle.delay(self._pending, time.monotonic())
+        if delay is None:
+            return
+        if delay <= 0:
+            self._async_publish()
+            return
+        self._unsub_publish = async_call_later(
+            self.hass, delay, self._async_publish_later
+        )
+
+    @callback
+    def _async_publish_later(self, _now: datetime) -> None:
+        """Publish a value held back by the throttle."""
+        self._unsub_publish = None
+        self._async_schedule_publish()
+
+    @callback
+    def _async_cancel_publish(self) -> None:
+        """Cancel a scheduled publish."""
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+
+    @callback
+    def _async_publish(self) -> None:
+        """Write the pending value and availability."""
+        self._async_cancel_publish()
+        if self._pending is not None:
+            self._attr_native_value = self._pending
+            self._throttle.publish(self._pending, time.monotonic())
+        self._update_statistics()
+        self._published_available = self.available
+        self.async_write_ha_state()
+
+
+class CentralControlMetricSensor(SensorEntity):
+    """Diagnostic sensor reporting the request metrics of the CentralControl.
+
+    The metrics change with every request, so the sensor is polled every
+    SCAN_INTERVAL instead of following the coordinator updates.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: CentralControlMetricDescription
+
+    def __init__(
+        self,
+        central_control: CentralControl,
+        entry_id: str,
+        name: str,
+        description: CentralControlMetricDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._metrics = central_control.metrics
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer=MANUFACTURER,
+            name=name,
+        )
+
+    @property
+    def native_value(self) -> int | float | None:
+        """Return the metric."""
+        return self.entity_description.value_fn(self._metrics.total)
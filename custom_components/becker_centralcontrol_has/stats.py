@@ -0,0 +1,105 @@
+"""Rolling statistics of recent sensor readings."""
+
+from array import array
+from collections import deque
+
+
+class RollingWindow:
+    """Readings of the last window seconds in a fixed size ring buffer.
+
+    The mean is kept as running sum and the maximum in a monotonic queue,
+    so adding and evicting a reading takes amortized O(1). If more than
+    capacity readings arrive within the window the oldest are dropped.
+    """
+
+    __slots__ = (
+        "_added",
+        "_capacity",
+        "_maxima",
+        "_size",
+        "_start",
+        "_sum",
+        "_times",
+        "_values",
+        "window",
+    )
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Init.
+
+        window -- seconds readings are kept for
+        capacity -- maximum number of readings kept
+        """
+
+        self.window = window
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+        self._added = 0
+        self._sum = 0.0
+        # Sequence number and value of the readings that can still become
+        # the maximum, values are decreasing.
+        self._maxima: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of readings kept."""
+
+        return self._size
+
+    def add(self, value: float, now: float) -> None:
+        """Add a reading taken at now."""
+
+        self._evict(now)
+        if self._size == self._capacity:
+            self._pop()
+
+        index = (self._start + self._size) % self._capacity
+        self._times[index] = now
+        self._values[index] = value
+        self._size += 1
+        self._sum += value
+
+        while self._maxima and self._maxima[-1][1] <= value:
+            self._maxima.pop()
+        self._maxima.append((self._added, value))
+        self._added += 1
+
+    def stats(self, now: float) -> dict[str, float | None]:
+        """Return maximum, mean and gust of the readings in the window.
+
+        The gust is the amount the maximum exceeds the mean by.
+        """
+
+        self._evict(now)
+        if not self._size:
+            return {"max": None, "mean": None, "gust": None}
+
+        maximum = self._maxima[0][1]
+        mean = self._sum / self._size
+        return {
+            "max": round(maximum, 1),
+            "mean": round(mean, 1),
+            "gust": round(maximum - mean, 1),
+        }
+
+    def _evict(self, now: float) -> None:
+        """Drop the readings older than the window."""
+
+        oldest = now - self.window
+        while self._size and self._times[self._start] < oldest:
+            self._pop()
+
+    def _pop(self) -> None:
+        """Drop the oldest reading."""
+
+        sequence = self._added - self._size
+        self._sum -= self._values[self._start]
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        if not self._size:
+            # Reset the running sum to not accumulate rounding errors.
+            self._sum = 0.0
+        if self._maxima and self._maxima[0][0] == sequence:
+            self._maxima.popleft()
@@ -0,0 +1,55 @@
+"""Throttle deciding when a changed sensor value is published."""
+
+
+class PublishThrottle:
+    """Deadband, minimum publish interval and heartbeat of a sensor value.
+
+    Changes smaller than the deadband are held back until the heartbeat is
+    due, other changes are published at most once per min_interval. A zero
+    disables the respective limit.
+    """
+
+    __slots__ = ("deadband", "heartbeat", "min_interval", "published", "published_at")
+
+    def __init__(
+        self, deadband: float = 0.0, min_interval: float = 0.0, heartbeat: float = 0.0
+    ) -> None:
+        """Init.
+
+        deadband -- changes smaller than this are not published on their own
+        min_interval -- minimum seconds between two published values
+        heartbeat -- seconds after which a held back change is published anyway
+        """
+
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.heartbeat = heartbeat
+        self.published: float | None = None
+        self.published_at = 0.0
+
+    def delay(self, value: float, now: float) -> float | None:
+        """Return the seconds until value is to be published.
+
+        Returns 0 to publish it now and None if it is not to be published
+        because it equals the published value or is held back by the
+        deadband without heartbeat.
+        """
+
+        if self.published is None:
+            return 0.0
+        if value == self.published:
+            return None
+
+        if abs(value - self.published) < self.deadband:
+            if not self.heartbeat:
+                return None
+            due = self.published_at + max(self.heartbeat, self.min_interval)
+        else:
+            due = self.published_at + self.min_interval
+        return max(0.0, due - now)
+
+    def publish(self, value: float, now: float) -> None:
+        """Record that value was published."""
+
+        self.published = value
+        self.published_at = now
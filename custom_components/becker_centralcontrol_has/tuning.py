@@ -0,0 +1,134 @@
+"""Request timeout and poll interval derived from measured latencies."""
+
+# Weights of a new sample in the averages and in the deviation (RFC 6298).
+ALPHA = 1 / 8
+BETA = 1 / 4
+# Deviations added to the expected latency for the timeout.
+DEVIATION_FACTOR = 4
+# Samples needed before the measured timeout replaces the default.
+MIN_SAMPLES = 8
+# Largest share of the time the controller may spend serving polls.
+POLL_DUTY_CYCLE = 0.1
+
+
+class LatencyModel:
+    """Latency of a request as round trip time plus service time per call.
+
+    Both are fitted by exponentially weighted least squares over the
+    latencies of successful requests, so a batch of many state calls and a
+    single command share one model. The mean deviation from the fit is
+    tracked like the RTT variance of TCP and a timed out request doubles
+    the timeout until a request succeeds again.
+    """
+
+    def __init__(
+        self, default_timeout: float, min_timeout: float, max_timeout: float
+    ) -> None:
+        """Init.
+
+        default_timeout -- timeout used until enough latencies were measured
+        min_timeout -- lower bound of the measured timeout
+        max_timeout -- upper bound of the measured timeout, also with backoff
+        """
+
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.samples = 0
+        self._backoff = 1
+        # Weighted means of calls, latency, calls squared and their product.
+        self._calls = 0.0
+        self._latency = 0.0
+        self._calls_sq = 0.0
+        self._product = 0.0
+        self._deviation = 0.0
+
+    @property
+    def rtt(self) -> float:
+        """Return the round trip time of a request without calls."""
+
+        return self._fit()[0]
+
+    @property
+    def service_time(self) -> float:
+        """Return the time the controller needs per call of a batch."""
+
+        return self._fit()[1]
+
+    def expected(self, calls: int) -> float:
+        """Return the expected latency of a request with calls calls."""
+
+        rtt, service_time = self._fit()
+        return rtt + service_time * calls
+
+    def record(self, calls: int, latency: float) -> None:
+        """Add the latency of a successful request."""
+
+        self._backoff = 1
+        if not self.samples:
+            self._calls = calls
+            self._latency = latency
+            self._calls_sq = calls * calls
+            self._product = calls * latency
+            self._deviation = latency / 2
+        else:
+            error = abs(latency - self.expected(calls))
+            self._deviation += BETA * (error - self._deviation)
+            self._calls += ALPHA * (calls - self._calls)
+            self._latency += ALPHA * (latency - self._latency)
+            self._calls_sq += ALPHA * (calls * calls - self._calls_sq)
+            self._product += ALPHA * (calls * latency - self._product)
+        self.samples += 1
+
+    def record_timeout(self) -> None:
+        """Back off after a request timed out."""
+
+        if self.timeout(1) < self.max_timeout:
+            self._backoff *= 2
+
+    def timeout(self, calls: int) -> float:
+        """Return the timeout of a request with calls calls."""
+
+        if self.samples < MIN_SAMPLES:
+            timeout = self.default_timeout
+        else:
+            timeout = self.expected(calls) + DEVIATION_FACTOR * self._deviation
+            timeout = max(self.min_timeout, timeout)
+        return min(self.max_timeout, timeout * self._backoff)
+
+    def poll_interval(self, calls: int) -> float | None:
+        """Return the shortest safe interval of polls with calls calls.
+
+        None until enough latencies were measured.
+        """
+
+        if self.samples < MIN_SAMPLES:
+            return None
+        return (
+            self.expected(calls) + DEVIATION_FACTOR * self._deviation
+        ) / POLL_DUTY_CYCLE
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the model for diagnostics."""
+
+        return {
+            "samples": self.samples,
+            "rtt": round(self.rtt, 4),
+            "service_time": round(self.service_time, 4),
+            "deviation": round(self._deviation, 4),
+            "backoff": self._backoff,
+            "timeout": round(self.timeout(1), 3),
+        }
+
+    def _fit(self) -> tuple[float, float]:
+        """Return round trip and service time fitted to the latencies."""
+
+        variance = self._calls_sq - self._calls * self._calls
+        if variance < 1e-6:
+            # All requests had the same size, attribute it all to the trip.
+            return self._latency, 0.0
+        service_time = max(
+            0.0, (self._product - self._calls * self._latency) / variance
+        )
+        rtt = max(0.0, self._latency - service_time * self._calls)
+        return rtt, service_time
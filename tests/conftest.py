@@ -0,0 +1,27 @@
+"""Fixtures for the CentralControl tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from .fake_controller import FakeCentralControl
+
+
+@pytest.fixture
+def bench_loop() -> Generator[asyncio.AbstractEventLoop]:
+    """Return a private event loop to drive async code from benchmarks."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+async def fake_controller() -> AsyncGenerator[FakeCentralControl]:
+    """Return a running fake controller with a few groups and a remote."""
+    controller = FakeCentralControl(groups=5, remotes=1)
+    await controller.start()
+    yield controller
+    await controller.stop()
@@ -0,0 +1,320 @@
+"""Local stand-in for the cc51rpc.cgi endpoint of a CentralControl."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import contextlib
+import itertools
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+
+RPC_PATH = "/cgi-bin/cc51rpc.cgi"
+
+DEFAULT_DEVICE_TYPES = ("shutter", "venetian", "awning", "dimmer", "switch")
+DEFAULT_REMOTE_TYPES = ("sensor-sun-wind-rain-temp", "sensor-sun-wind")
+
+
+class FakeCentralControl:
+    """Speak the deviced JSON-RPC dialect with NUL-terminated framing.
+
+    Groups get the ids 1..groups, remotes the following ids. Device and
+    remote types are assigned round robin from the given sequences. Every
+    request is delayed by latency plus a random share of jitter seconds.
+
+    With frame_per_response batch responses are sent as one frame per call
+    and with chunk_size the body is streamed in chunks of that many bytes.
+
+    With push deviced.wait_for_changes long polls are answered as soon as an
+    item changed, otherwise the method is not implemented.
+
+    group_members maps parent group ids to their member group ids, commands
+    to a parent group are applied to its members. Groups without members
+    hold one receiver, group_receivers adds receivers held by a group
+    directly. The receivers of a group include those of its members.
+    """
+
+    def __init__(
+        self,
+        groups: int = 10,
+        remotes: int = 1,
+        device_types: Sequence[str] = DEFAULT_DEVICE_TYPES,
+        remote_types: Sequence[str] = DEFAULT_REMOTE_TYPES,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        frame_per_response: bool = False,
+        chunk_size: int | None = None,
+        push: bool = False,
+        group_members: dict[int, Sequence[int]] | None = None,
+        group_receivers: dict[int, Sequence[int]] | None = None,
+    ) -> None:
+        """Init."""
+
+        self.latency = latency
+        self.jitter = jitter
+        self.frame_per_response = frame_per_response
+        self.chunk_size = chunk_size
+        self.push = push
+        self.group_members = dict(group_members or {})
+        self.group_receivers = dict(group_receivers or {})
+        # group_id, command and value of every command received.
+        self.commands: list[tuple[int, str, float]] = []
+        self.requests = 0
+        self.calls = 0
+        self.methods: dict[str, int] = {}
+
+        device_type = itertools.cycle(device_types)
+        remote_type = itertools.cycle(remote_types)
+        self.groups: dict[int, dict[str, Any]] = {
+            item_id: {
+                "id": item_id,
+                "item_type": "group",
+                "name": f"Group {item_id}",
+                "icon": "",
+                "device_type": next(device_type),
+                "feedback": True,
+                "backend": "centronicplus",
+            }
+            for item_id in range(1, groups + 1)
+        }
+        self.remotes: dict[int, dict[str, Any]] = {
+            item_id: {
+                "id": item_id,
+                "item_type": "remote",
+                "name": f"Remote {item_id}",
+                "icon": "",
+                "remote_type": next(remote_type),
+            }
+            for item_id in range(groups + 1, groups + remotes + 1)
+        }
+        self.group_states: dict[int, dict[str, Any]] = {
+            item_id: {
+                "value": 0,
+                "mode": "",
+                "moving_up": 0,
+                "moving_down": 0,
+                "error_flags": [],
+                "error_count": 0,
+                "scheduled_cmd": False,
+            }
+            for item_id in self.groups
+        }
+        self.remote_states: dict[int, dict[str, Any]] = {
+            item_id: {
+                "value-sun": 5,
+                "value-wind": 2,
+                "value-rain": 0,
+                "value-temp": 21.5,
+                "value-dawn": 3,
+            }
+            for item_id in self.remotes
+        }
+
+        # Item ids in the order they changed, the cursor is the list length.
+        self.changes: list[int] = []
+        self._changed = asyncio.Event()
+
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+
+    @property
+    def address(self) -> str:
+        """Return the address to pass to CentralControl."""
+
+        return f"127.0.0.1:{self.port}"
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+
+        app = web.Application()
+        app.router.add_post(RPC_PATH, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a single JSON-RPC request or a batch."""
+
+        self.requests += 1
+        body = await request.read()
+        data = json.loads(body.split(b"\0", 1)[0])
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        if isinstance(data, list):
+            result: Any = [self._call(call) for call in data]
+        elif self.push and data.get("method") == "deviced.wait_for_changes":
+            result = await self._long_poll(data)
+        else:
+            result = self._call(data)
+
+        if self.frame_per_response and isinstance(result, list):
+            body = b"".join(
+                json.dumps(response).encode() + b"\0" for response in result
+            )
+        else:
+            body = json.dumps(result).encode() + b"\0"
+
+        if self.chunk_size is None:
+            return web.Response(body=body, content_type="text/plain")
+
+        response = web.StreamResponse()
+        response.content_type = "text/plain"
+        await response.prepare(request)
+        for start in range(0, len(body), self.chunk_size):
+            await response.write(body[start : start + self.chunk_size])
+        await response.write_eof()
+        return response
+
+    def set_group_state(self, group_id: int, **state: Any) -> None:
+        """Change the state of a group and wake up waiting long polls."""
+
+        self.group_states[group_id].update(state)
+        self._notify(group_id)
+
+    def _notify(self, item_id: int) -> None:
+        """Record a change of an item and wake up waiting long polls."""
+
+        self.changes.append(item_id)
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _state(self, item_id: int) -> dict[str, Any]:
+        """Return the combined group and item state of an item."""
+
+        return {
+            **self.group_states.get(item_id, {}),
+            **self.remote_states.get(item_id, {}),
+        }
+
+    async def _long_poll(self, call: dict[str, Any]) -> dict[str, Any]:
+        """Answer a deviced.wait_for_changes long poll."""
+
+        self.calls += 1
+        self.methods[call["method"]] = self.methods.get(call["method"], 0) + 1
+        cursor = call["params"].get("cursor")
+        timeout = call["params"].get("timeout", 25)
+
+        if cursor is None or not 0 <= cursor <= len(self.changes):
+            result = {"cursor": len(self.changes), "changes": [], "reset": True}
+            return {"jsonrpc": "2.0", "id": call.get("id"), "result": result}
+
+        if cursor == len(self.changes):
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._changed.wait(), timeout)
+
+        changed = dict.fromkeys(self.changes[cursor:])
+        result = {
+            "cursor": len(self.changes),
+            "changes": [
+                {"item_id": item_id, "state": self._state(item_id)}
+                for item_id in changed
+            ],
+        }
+        return {"jsonrpc": "2.0", "id": call.get("id"), "result": result}
+
+    def _call(self, call: dict[str, Any]) -> dict[str, Any]:
+        """Answer a single JSON-RPC call."""
+
+        self.calls += 1
+        method = call.get("method", "")
+        self.methods[method] = self.methods.get(method, 0) + 1
+        params = call.get("params", {})
+
+        handler = getattr(self, "_" + method.removeprefix("deviced."), None)
+        if handler is None:
+            return _error(call, -32601, "Method not found")
+        try:
+            return {"jsonrpc": "2.0", "id": call.get("id"), "result": handler(**params)}
+        except (KeyError, TypeError, ValueError) as err:
+            return _error(call, -32602, f"Invalid params: {err!r}")
+
+    def _deviced_get_item_list(
+        self,
+        item_type: str | None = None,
+        list_type: str | None = None,
+        parent_id: int | None = None,
+        action: str | None = None,
+    ) -> dict[str, Any]:
+        if list_type == "groups" and parent_id is not None:
+            return {
+                "item_list": [
+                    self.groups[member]
+                    for member in self.group_members.get(parent_id, ())
+                ]
+            }
+        if list_type == "receivers" and parent_id is not None:
+            return {
+                "item_list": [
+                    {"id": receiver_id, "item_type": "receiver"}
+                    for receiver_id in sorted(self._receivers(parent_id))
+                ]
+            }
+        items = [*self.groups.values(), *self.remotes.values()]
+        if item_type is not None:
+            items = [item for item in items if item["item_type"] == item_type]
+        return {"item_list": items}
+
+    def _receivers(self, group_id: int) -> set[int]:
+        """Return the ids of the receivers a group moves."""
+        members = self.group_members.get(group_id, ())
+        receivers = set(
+            self.group_receivers.get(group_id, () if members else (1000 + group_id,))
+        )
+        for member in members:
+            receivers |= self._receivers(member)
+        return receivers
+
+    def _group_get_state(self, group_id: int) -> dict[str, Any]:
+        return {"state": self.group_states[group_id]}
+
+    def _item_get_state(self, item_id: int) -> dict[str, Any]:
+        if item_id in self.remote_states:
+            return {"state": self.remote_states[item_id]}
+        if item_id in self.group_states:
+            return {"state": {}}
+        raise KeyError(item_id)
+
+    def _group_send_command(
+        self, group_id: int, command: str, value: float
+    ) -> dict[str, Any]:
+        self.commands.append((group_id, command, value))
+        self._apply_command(group_id, command, value)
+        return {}
+
+    def _apply_command(self, group_id: int, command: str, value: float) -> None:
+        """Apply a command to a group and all its member groups."""
+
+        for member in self.group_members.get(group_id, ()):
+            self._apply_command(member, command, value)
+        state = self.group_states[group_id]
+        if command == "move" and value:
+            state["value"] = 100 if value > 0 else 0
+        elif command in ("moveto", "dimto"):
+            state["value"] = value
+        elif command == "switch":
+            state["value"] = 100 if value else 0
+        self._notify(group_id)
+
+
+def _error(call: dict[str, Any], code: int, message: str) -> dict[str, Any]:
+    """Return a JSON-RPC error response."""
+
+    return {
+        "jsonrpc": "2.0",
+        "id": call.get("id"),
+        "error": {"code": code, "message": message},
+    }
@@ -0,0 +1,134 @@
+"""Benchmarks of the CentralControl client against a fake controller.
+
+Run with ``pytest tests --benchmark-only``. Every benchmark is run for 10, 100
+and 500 groups so regressions and improvements can be compared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+import tracemalloc
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+)
+from custom_components.becker_centralcontrol_has.const import COVER_MAPPING, DOMAIN
+from custom_components.becker_centralcontrol_has.coordinator import (
+    CentralControlCoordinator,
+)
+from custom_components.becker_centralcontrol_has.cover import BeckerCover
+from custom_components.becker_centralcontrol_has.discovery import async_discover
+from custom_components.becker_centralcontrol_has.models import BeckerItem
+from homeassistant.core import HomeAssistant
+
+from .fake_controller import FakeCentralControl
+
+GROUP_COUNTS = (10, 100, 500)
+
+
+@pytest.fixture(params=GROUP_COUNTS, ids=lambda groups: f"{groups}_groups")
+def controller(
+    request: pytest.FixtureRequest, bench_loop: asyncio.AbstractEventLoop
+) -> Generator[FakeCentralControl]:
+    """Return a running fake controller with one remote per 20 groups."""
+    fake = FakeCentralControl(groups=request.param, remotes=max(1, request.param // 20))
+    bench_loop.run_until_complete(fake.start())
+    yield fake
+    bench_loop.run_until_complete(fake.stop())
+
+
+@pytest.fixture
+def client(
+    controller: FakeCentralControl, bench_loop: asyncio.AbstractEventLoop
+) -> Generator[CentralControl]:
+    """Return a client connected to the fake controller."""
+    central_control = CentralControl(address=controller.address)
+    yield central_control
+    bench_loop.run_until_complete(central_control.async_close())
+
+
+def test_setup_discovery(
+    benchmark, bench_loop, controller: FakeCentralControl, client: CentralControl
+) -> None:
+    """Benchmark the discovery every entry setup waits for."""
+    discovery = benchmark(lambda: bench_loop.run_until_complete(async_discover(client)))
+
+    assert discovery is not None
+    assert sum(map(len, discovery.groups.values())) == len(controller.groups)
+    assert sum(map(len, discovery.remotes.values())) == len(controller.remotes)
+
+
+def test_poll_cycle(
+    benchmark, bench_loop, controller: FakeCentralControl, client: CentralControl
+) -> None:
+    """Benchmark a full poll of every group and remote."""
+    item_ids = [*controller.groups, *controller.remotes]
+    client.set_item_types(
+        {
+            **dict.fromkeys(controller.groups, "group"),
+            **dict.fromkeys(controller.remotes, "remote"),
+        }
+    )
+
+    states = benchmark(
+        lambda: bench_loop.run_until_complete(client.get_states(item_ids))
+    )
+
+    assert states.keys() == set(item_ids)
+
+    controller.requests = 0
+    controller.calls = 0
+    bench_loop.run_until_complete(client.get_states(item_ids))
+    benchmark.extra_info["requests_per_cycle"] = controller.requests
+    benchmark.extra_info["calls_per_cycle"] = controller.calls
+
+
+def test_command_fan_out(
+    benchmark, bench_loop, controller: FakeCentralControl, client: CentralControl
+) -> None:
+    """Benchmark sending a command to every group at once."""
+
+    async def fan_out() -> list[dict]:
+        return await asyncio.gather(
+            *(
+                client.group_send_command(group_id=group_id, command="move", value=1)
+                for group_id in controller.groups
+            )
+        )
+
+    results = benchmark(lambda: bench_loop.run_until_complete(fan_out()))
+
+    assert all("result" in result for result in results)
+    benchmark.extra_info["commands"] = len(controller.groups)
+
+
+@pytest.mark.parametrize("groups", GROUP_COUNTS, ids=lambda groups: f"{groups}_groups")
+async def test_memory_per_entity(
+    hass: HomeAssistant, enable_custom_integrations: None, benchmark, groups: int
+) -> None:
+    """Benchmark creating cover entities and record their memory footprint."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host_address": "127.0.0.1"})
+    entry.add_to_hass(hass)
+    central_control = CentralControl(address="127.0.0.1")
+    coordinator = CentralControlCoordinator(hass, entry, central_control)
+    items = [
+        BeckerItem.from_dict(item)
+        for item in FakeCentralControl(groups=groups).groups.values()
+        if item["device_type"] in COVER_MAPPING
+    ]
+
+    def build() -> list[BeckerCover]:
+        return [BeckerCover(coordinator=coordinator, item=item) for item in items]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    benchmark.extra_info["bytes_per_entity"] = (after - before) / len(entities)
+    benchmark(build)
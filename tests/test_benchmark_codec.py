@@ -0,0 +1,103 @@
+"""Benchmarks of the framing codec against the previous json based path."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from custom_components.becker_centralcontrol_has.codec import FrameDecoder, encode
+
+from .fake_controller import FakeCentralControl
+
+GROUP_COUNTS = (10, 100, 500)
+# Size of the chunks a response body is streamed in, as read by iter_any.
+CHUNK_SIZE = 16384
+
+
+def _legacy_encode(data: Any) -> bytes:
+    """Encode like _jrpc_request did before the codec."""
+    return (json.dumps(data) + "\0").encode()
+
+
+def _legacy_decode(body: bytes) -> Any:
+    """Decode like _jrpc_request did before the codec."""
+    return json.loads(body.decode().replace("\0", ""))
+
+
+def _stream_decode(body: bytes) -> Any:
+    """Decode a body streamed in chunks like _jrpc_request does."""
+    decoder = FrameDecoder()
+    messages = []
+    for start in range(0, len(body), CHUNK_SIZE):
+        messages.extend(decoder.feed(body[start : start + CHUNK_SIZE]))
+    messages.extend(decoder.close())
+    return messages[0]
+
+
+def _item_list_response(groups: int) -> bytes:
+    """Return a deviced_get_item_list response for the given group count."""
+    fake = FakeCentralControl(groups=groups, remotes=max(1, groups // 20))
+    items = [*fake.groups.values(), *fake.remotes.values()]
+    return _legacy_encode({"jsonrpc": "2.0", "id": 0, "result": {"item_list": items}})
+
+
+def _state_batch_response(groups: int) -> bytes:
+    """Return a batched group_get_state response for the given group count."""
+    fake = FakeCentralControl(groups=groups, remotes=0)
+    return _legacy_encode(
+        [
+            {"jsonrpc": "2.0", "id": request_id, "result": {"state": state}}
+            for request_id, state in enumerate(fake.group_states.values())
+        ]
+    )
+
+
+def _state_batch_request(groups: int) -> list[dict[str, Any]]:
+    """Return a batched group_get_state request for the given group count."""
+    return [
+        {
+            "jsonrpc": "2.0",
+            "id": group_id,
+            "params": {"group_id": group_id},
+            "method": "deviced.group_get_state",
+        }
+        for group_id in range(1, groups + 1)
+    ]
+
+
+@pytest.mark.parametrize("groups", GROUP_COUNTS, ids=lambda groups: f"{groups}_groups")
+@pytest.mark.parametrize("codec", ["legacy", "codec"])
+def test_decode_item_list(benchmark, codec: str, groups: int) -> None:
+    """Benchmark decoding an item list response."""
+    body = _item_list_response(groups)
+    decoder = _stream_decode if codec == "codec" else _legacy_decode
+
+    result = benchmark(decoder, body)
+
+    assert result == _legacy_decode(body)
+
+
+@pytest.mark.parametrize("groups", GROUP_COUNTS, ids=lambda groups: f"{groups}_groups")
+@pytest.mark.parametrize("codec", ["legacy", "codec"])
+def test_decode_state_batch(benchmark, codec: str, groups: int) -> None:
+    """Benchmark decoding a batched state response."""
+    body = _state_batch_response(groups)
+    decoder = _stream_decode if codec == "codec" else _legacy_decode
+
+    result = benchmark(decoder, body)
+
+    assert len(result) == groups
+
+
+@pytest.mark.parametrize("groups", GROUP_COUNTS, ids=lambda groups: f"{groups}_groups")
+@pytest.mark.parametrize("codec", ["legacy", "codec"])
+def test_encode_state_batch(benchmark, codec: str, groups: int) -> None:
+    """Benchmark encoding a batched state request."""
+    data = _state_batch_request(groups)
+    encoder = encode if codec == "codec" else _legacy_encode
+
+    frame = benchmark(encoder, data)
+
+    assert json.loads(frame[:-1]) == data
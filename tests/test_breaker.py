@@ -0,0 +1,74 @@
+"""Tests for the circuit breaker."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.becker_centralcontrol_has import breaker
+from custom_components.becker_centralcontrol_has.breaker import (
+    BreakerState,
+    CircuitBreaker,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Return the time seen by the breaker, settable by the test."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_after_consecutive_failures(clock: list[float]) -> None:
+    """Test the breaker opens after the threshold and a success resets it."""
+    circuit = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    circuit.record_failure()
+    circuit.record_failure()
+    circuit.record_success()
+    circuit.record_failure()
+    circuit.record_failure()
+    assert circuit.state is BreakerState.CLOSED
+    assert circuit.allow_request()
+
+    circuit.record_failure()
+    assert circuit.state is BreakerState.OPEN
+    assert circuit.failures == 3
+    assert not circuit.allow_request()
+    assert not circuit.allow_request(probe=True)
+
+
+def test_half_open_allows_one_probe(clock: list[float]) -> None:
+    """Test a half open breaker lets a single probe through."""
+    circuit = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    circuit.record_failure()
+
+    clock[0] += 60
+    assert circuit.state is BreakerState.HALF_OPEN
+    assert not circuit.allow_request()
+    assert circuit.allow_request(probe=True)
+    assert not circuit.allow_request(probe=True)
+
+    circuit.release_probe()
+    assert circuit.allow_request(probe=True)
+
+    circuit.record_success()
+    assert circuit.state is BreakerState.CLOSED
+    assert circuit.failures == 0
+
+
+def test_failed_probe_reopens(clock: list[float]) -> None:
+    """Test a failed probe opens the breaker for another reset timeout."""
+    circuit = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    for _ in range(5):
+        circuit.record_failure()
+
+    clock[0] += 60
+    assert circuit.allow_request(probe=True)
+    circuit.record_failure()
+
+    assert circuit.state is BreakerState.OPEN
+    clock[0] += 59
+    assert circuit.state is BreakerState.OPEN
+    clock[0] += 1
+    assert circuit.state is BreakerState.HALF_OPEN
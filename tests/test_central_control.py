@@ -0,0 +1,355 @@
+"""Tests for the CentralControl client against the fake controller."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.becker_centralcontrol_has import central_control as client
+from custom_components.becker_centralcontrol_has.breaker import BreakerState
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+    CentralControlConnectionError,
+    CentralControlNotSupportedError,
+    CentralControlUnavailableError,
+)
+
+from .fake_controller import FakeCentralControl
+
+
+@pytest.mark.parametrize("frame_per_response", [False, True])
+@pytest.mark.parametrize("chunk_size", [None, 7])
+async def test_get_states_streamed(
+    frame_per_response: bool, chunk_size: int | None
+) -> None:
+    """Test batched states are decoded from single and chunked frames."""
+    controller = FakeCentralControl(
+        groups=20,
+        remotes=2,
+        frame_per_response=frame_per_response,
+        chunk_size=chunk_size,
+    )
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+    dispatched: dict[int, dict] = {}
+
+    try:
+        states = await central_control.get_states(
+            range(1, 23), on_state=dispatched.__setitem__
+        )
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+    assert len(states) == 22
+    assert states[21] == controller.remote_states[21]
+    assert dispatched == states
+    assert controller.requests == 1
+
+
+@pytest.mark.parametrize("frame_per_response", [False, True])
+async def test_get_states_single_response(frame_per_response: bool) -> None:
+    """Test a batch answered by a single response is not dropped."""
+    controller = FakeCentralControl(
+        groups=2, remotes=0, frame_per_response=frame_per_response
+    )
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+    central_control.set_item_types({1: "group", 2: "group"})
+
+    try:
+        states = await central_control.get_states([1])
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+    assert states == {1: controller.group_states[1]}
+
+
+async def test_unreachable_controller(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reads are retried, commands are not and the breaker opens."""
+    monkeypatch.setattr(client, "RETRY_BACKOFF", 0)
+    # Nothing listens on port 1, connections are refused right away.
+    central_control = CentralControl(address="127.0.0.1:1")
+
+    try:
+        with pytest.raises(CentralControlConnectionError):
+            await central_control.get_states([1])
+        assert central_control.breaker_failures == client.READ_RETRIES + 1
+
+        with pytest.raises(CentralControlConnectionError):
+            await central_control.group_send_command(1, "move", 1)
+        assert central_control.breaker_failures == client.READ_RETRIES + 2
+
+        # The fifth failure opens the breaker, the retry is rejected.
+        with pytest.raises(CentralControlUnavailableError):
+            await central_control.get_states([1])
+        assert central_control.breaker_state is BreakerState.OPEN
+        assert central_control.breaker_failures == 5
+
+        with pytest.raises(CentralControlUnavailableError):
+            await central_control.group_send_command(1, "move", 1)
+        assert central_control.breaker_failures == 5
+    finally:
+        await central_control.async_close()
+
+
+async def test_wait_for_changes_not_supported(
+    fake_controller: FakeCentralControl,
+) -> None:
+    """Test controllers without long poll support are detected."""
+    central_control = CentralControl(address=fake_controller.address)
+
+    try:
+        with pytest.raises(CentralControlNotSupportedError):
+            await central_control.wait_for_changes()
+    finally:
+        await central_control.async_close()
+
+
+async def test_wait_for_changes() -> None:
+    """Test changes are returned as soon as they happen."""
+    controller = FakeCentralControl(groups=3, remotes=0, push=True)
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+
+    try:
+        cursor, states = await central_control.wait_for_changes()
+        assert states is None
+
+        waiting = asyncio.create_task(central_control.wait_for_changes(cursor))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+
+        controller.set_group_state(2, value=40, moving_down=1)
+        cursor, states = await asyncio.wait_for(waiting, 5)
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+    assert cursor == 1
+    assert states == {2: controller.group_states[2]}
+    assert states[2]["moving_down"] == 1
+
+
+async def test_commands_collapse_into_parent_group() -> None:
+    """Test the same command to every member is sent to the parent once."""
+    # Group 1 is a floor with the rooms 2 and 3, room 3 holds groups 4 and 5.
+    members = {1: [2, 3], 3: [4, 5]}
+    controller = FakeCentralControl(groups=6, remotes=0, group_members=members)
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+
+    try:
+        discovered = await central_control.get_group_members(controller.groups)
+        assert discovered == members
+        central_control.set_group_members(discovered)
+
+        results = await asyncio.gather(
+            *(
+                central_control.group_send_command(group_id, "move", 1)
+                for group_id in (2, 4, 5)
+            )
+        )
+        assert controller.commands == [(1, "move", 1)]
+        assert all("result" in result for result in results)
+
+        controller.commands.clear()
+        await asyncio.gather(
+            central_control.group_send_command(4, "move", 1),
+            central_control.group_send_command(5, "move", 1),
+            central_control.group_send_command(6, "move", 1),
+        )
+        assert sorted(controller.commands) == [(3, "move", 1), (6, "move", 1)]
+
+        controller.commands.clear()
+        await asyncio.gather(
+            central_control.group_send_command(4, "move", 1),
+            central_control.group_send_command(5, "move", -1),
+        )
+        assert sorted(controller.commands) == [(4, "move", 1), (5, "move", -1)]
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+
+async def test_command_replaced_within_batch_window(
+    fake_controller: FakeCentralControl,
+) -> None:
+    """Test a later command to a group replaces the queued one."""
+    central_control = CentralControl(address=fake_controller.address)
+
+    try:
+        results = await asyncio.gather(
+            central_control.group_send_command(2, "move", 1),
+            central_control.group_send_command(2, "move", -1),
+        )
+    finally:
+        await central_control.async_close()
+
+    assert fake_controller.requests == 1
+    assert fake_controller.commands == [(2, "move", -1)]
+    assert results[0] == results[1]
+    assert "result" in results[0]
+
+
+async def test_collapse_commands() -> None:
+    """Test queued commands collapse into the largest parent group possible."""
+    central_control = CentralControl(address="127.0.0.1")
+    central_control.set_group_members({1: [2, 3], 3: [4, 5]})
+
+    queue = {leaf: ("move", 1, [f"waiter {leaf}"]) for leaf in (2, 4, 5)}
+    central_control._collapse_commands(queue)
+    assert queue.keys() == {1}
+    assert queue[1][:2] == ("move", 1)
+    assert sorted(queue[1][2]) == ["waiter 2", "waiter 4", "waiter 5"]
+
+    queue = {leaf: ("move", 1, [f"waiter {leaf}"]) for leaf in (4, 5, 6)}
+    central_control._collapse_commands(queue)
+    assert queue.keys() == {3, 6}
+    assert sorted(queue[3][2]) == ["waiter 4", "waiter 5"]
+
+    queue = {2: ("move", 1, []), 4: ("move", 1, []), 5: ("moveto", 50, [])}
+    central_control._collapse_commands(queue)
+    assert queue.keys() == {2, 4, 5}
+
+    # A command queued for the parent itself is left alone.
+    queue = {leaf: ("move", 1, []) for leaf in (1, 4, 5)}
+    central_control._collapse_commands(queue)
+    assert queue.keys() == {1, 3}
+
+
+async def test_get_group_members_chunked() -> None:
+    """Test the member lookup of many groups is split into several batches."""
+    controller = FakeCentralControl(
+        groups=120, remotes=0, group_members={1: [2, 3], 120: [4]}
+    )
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+
+    try:
+        members = await central_control.get_group_members(controller.groups)
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+    assert members == {1: [2, 3], 120: [4]}
+    # Three batches of member groups and one of receivers.
+    assert controller.requests == 4
+
+
+async def test_commands_not_collapsed_into_group_with_own_receivers() -> None:
+    """Test a parent group moving more than its members is not used."""
+    controller = FakeCentralControl(
+        groups=4, remotes=0, group_members={1: [2, 3]}, group_receivers={1: [99]}
+    )
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+
+    try:
+        members = await central_control.get_group_members(controller.groups)
+        assert members == {}
+        central_control.set_group_members(members)
+
+        await central_control.group_send_commands([(2, "move", 1), (3, "move", 1)])
+        assert sorted(controller.commands) == [(2, "move", 1), (3, "move", 1)]
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+
+async def test_group_send_commands_batched() -> None:
+    """Test commands to several groups go out in one batch."""
+    controller = FakeCentralControl(groups=4, remotes=0, group_members={1: [2, 3]})
+    await controller.start()
+    central_control = CentralControl(address=controller.address)
+    central_control.set_group_members(controller.group_members)
+
+    try:
+        results = await central_control.group_send_commands(
+            [(4, "moveto", 30), (2, "move", 1), (3, "move", -1)]
+        )
+        assert controller.requests == 1
+        assert controller.commands == [
+            (4, "moveto", 30),
+            (2, "move", 1),
+            (3, "move", -1),
+        ]
+        assert len(results) == 3
+        assert all("result" in result for result in results)
+
+        # The batch still collapses into the parent group.
+        controller.commands.clear()
+        await central_control.group_send_commands([(2, "move", 1), (3, "move", 1)])
+        assert controller.commands == [(1, "move", 1)]
+    finally:
+        await central_control.async_close()
+        await controller.stop()
+
+
+async def test_get_states_planned_by_item_type(
+    fake_controller: FakeCentralControl,
+) -> None:
+    """Test groups and remotes are only queried with the call they need."""
+    central_control = CentralControl(address=fake_controller.address)
+    central_control.set_item_types(
+        {
+            **dict.fromkeys(fake_controller.groups, "group"),
+            **dict.fromkeys(fake_controller.remotes, "remote"),
+        }
+    )
+    item_ids = [*fake_controller.groups, *fake_controller.remotes]
+
+    try:
+        states = await central_control.get_states(item_ids)
+        assert fake_controller.methods == {
+            "deviced.group_get_state": len(fake_controller.groups),
+            "deviced.item_get_state": len(fake_controller.remotes),
+        }
+
+        merged = await central_control.get_states(item_ids, merged=True)
+    finally:
+        await central_control.async_close()
+
+    assert states == merged
+    assert fake_controller.calls == 3 * len(item_ids)
+
+
+async def test_get_state_coalesced(fake_controller: FakeCentralControl) -> None:
+    """Test concurrent get_state calls for an item share one request."""
+    central_control = CentralControl(address=fake_controller.address)
+
+    try:
+        states = await asyncio.gather(*(central_control.get_state(1) for _ in range(3)))
+        assert fake_controller.requests == 1
+        assert central_control.state_request_stats == {"hits": 2, "misses": 1}
+
+        # Results are reused within the coalesce window.
+        assert await central_control.get_state(1) == states[0]
+        assert fake_controller.requests == 1
+        assert central_control.state_request_stats == {"hits": 3, "misses": 1}
+
+        # Polled states do not fill the cache.
+        await central_control.get_states([2])
+        await central_control.get_state(2)
+        assert fake_controller.requests == 3
+        assert central_control.state_request_stats == {"hits": 3, "misses": 2}
+    finally:
+        await central_control.async_close()
+
+    assert states[0] == states[1] == states[2] == fake_controller.group_states[1]
+
+
+async def test_timeout_bounds() -> None:
+    """Test the default timeout is kept within the configured bounds."""
+    central_control = CentralControl(address="127.0.0.1")
+    assert central_control.latency.timeout(1) == client.DEFAULT_TIMEOUT
+
+    central_control = CentralControl(address="127.0.0.1", min_timeout=15)
+    assert central_control.latency.timeout(1) == 15
+
+    central_control = CentralControl(address="127.0.0.1", max_timeout=5)
+    assert central_control.latency.timeout(1) == 5
+    central_control.latency.record_timeout()
+    assert central_control.latency.timeout(1) == 5
@@ -0,0 +1,86 @@
+"""Tests for the cc51rpc framing codec."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.becker_centralcontrol_has.codec import FrameDecoder, encode
+
+
+def test_encode_terminates_frame() -> None:
+    """Test requests are encoded to a single NUL-terminated frame."""
+    frame = encode({"jsonrpc": "2.0", "id": 0, "method": "deviced.group_get_state"})
+
+    assert frame.endswith(b"\0")
+    assert frame.count(b"\0") == 1
+    assert json.loads(frame[:-1])["method"] == "deviced.group_get_state"
+
+
+@pytest.mark.parametrize(
+    ("body", "messages"),
+    [
+        (b'{"id":1}\0', [{"id": 1}]),
+        (b'{"id":1}', [{"id": 1}]),
+        (b'\0\0{"id":1}\0', [{"id": 1}]),
+        (b'{"id":1}\0{"id":2}\0', [{"id": 1}, {"id": 2}]),
+    ],
+    ids=["terminated", "unterminated", "leading_terminators", "trailing_frame"],
+)
+def test_frame_decoder_body(body: bytes, messages: list) -> None:
+    """Test the frames of a whole body are decoded."""
+    decoder = FrameDecoder()
+    assert [*decoder.feed(body), *decoder.close()] == messages
+
+
+def test_frame_decoder_truncated() -> None:
+    """Test a stream ending inside a frame raises a JSONDecodeError."""
+    decoder = FrameDecoder()
+    assert decoder.feed(b'{"id":') == []
+    with pytest.raises(json.JSONDecodeError):
+        decoder.close()
+    assert decoder.pending == 6
+
+
+def test_frame_decoder_split_and_concatenated() -> None:
+    """Test frames are yielded as soon as their terminator arrived."""
+    decoder = FrameDecoder()
+
+    assert decoder.feed(b'{"id":0}\0{"id"') == [{"id": 0}]
+    assert decoder.pending == 5
+    assert decoder.feed(b":1}\0\0") == [{"id": 1}]
+    assert decoder.feed(b'[{"id":2},{"id":3}]\0{"id":4}\0') == [
+        [{"id": 2}, {"id": 3}],
+        {"id": 4},
+    ]
+    assert decoder.pending == 0
+    assert decoder.close() == []
+
+
+def test_frame_decoder_byte_by_byte() -> None:
+    """Test a frame fed one byte at a time."""
+    decoder = FrameDecoder()
+    frame = encode({"id": 0, "result": {"state": {"value": 42}}})
+
+    messages = [message for byte in frame for message in decoder.feed(bytes([byte]))]
+
+    assert messages == [{"id": 0, "result": {"state": {"value": 42}}}]
+
+
+def test_frame_decoder_unterminated_last_frame() -> None:
+    """Test a last frame without terminator is decoded on close."""
+    decoder = FrameDecoder()
+
+    assert decoder.feed(b'{"id":0}\0{"id":1}') == [{"id": 0}]
+    assert decoder.close() == [{"id": 1}]
+
+
+def test_frame_decoder_truncated_frame() -> None:
+    """Test a stream ending inside a frame raises on close."""
+    decoder = FrameDecoder()
+    decoder.feed(b'{"id":0}\0{"id":')
+
+    with pytest.raises(json.JSONDecodeError):
+        decoder.close()
+    assert decoder.pending == 6
@@ -0,0 +1,324 @@
+"""Tests for the CentralControl coordinator against the fake controller."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.becker_centralcontrol_has import (
+    coordinator as coordinator_module,
+)
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+    CentralControlError,
+)
+from custom_components.becker_centralcontrol_has.const import (
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    DOMAIN,
+    FAST_SCAN_INTERVAL,
+    LISTEN_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+)
+from custom_components.becker_centralcontrol_has.coordinator import (
+    CentralControlCoordinator,
+)
+from homeassistant.core import HomeAssistant
+
+from .fake_controller import FakeCentralControl
+
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant,
+    controller: FakeCentralControl,
+    options: dict[str, Any] | None = None,
+) -> tuple[CentralControlCoordinator, list[int]]:
+    """Return a coordinator with a listener for every group."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"host_address": controller.address}, options=options
+    )
+    entry.add_to_hass(hass)
+    coordinator = CentralControlCoordinator(
+        hass, entry, CentralControl(address=controller.address)
+    )
+    updates: list[int] = []
+    for group_id in controller.groups:
+        coordinator.async_add_listener(
+            lambda group_id=group_id: updates.append(group_id), context=group_id
+        )
+    return coordinator, updates
+
+
+async def test_only_changed_items_notified(hass: HomeAssistant) -> None:
+    """Test a poll only notifies the listeners of changed items."""
+    controller = FakeCentralControl(groups=3, remotes=0)
+    await controller.start()
+    coordinator, updates = await _async_setup_coordinator(hass, controller)
+    unfiltered: list[None] = []
+    remove_unfiltered = coordinator.async_add_listener(lambda: unfiltered.append(None))
+
+    try:
+        await coordinator.async_refresh()
+        assert sorted(updates) == [1, 2, 3]
+        assert len(unfiltered) == 1
+
+        updates.clear()
+        controller.set_group_state(2, value=40)
+        await coordinator.async_refresh()
+
+        assert updates == [2]
+        assert len(unfiltered) == 2
+        assert coordinator.skipped_writes == 2
+        assert coordinator.skipped_writes_total == 2
+        assert coordinator.unfiltered_listeners == 1
+
+        updates.clear()
+        await coordinator.async_refresh()
+        assert updates == []
+        assert coordinator.skipped_writes == 3
+        assert coordinator.skipped_writes_total == 5
+
+        remove_unfiltered()
+        remove_item = coordinator.async_add_listener(
+            lambda: updates.append(-2), context=2
+        )
+        controller.set_group_state(2, value=60)
+        await coordinator.async_refresh()
+        assert updates == [2, -2]
+        assert len(unfiltered) == 3
+        assert coordinator.unfiltered_listeners == 0
+
+        remove_item()
+        updates.clear()
+        controller.set_group_state(2, value=80)
+        await coordinator.async_refresh()
+        assert updates == [2]
+    finally:
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_overlapping_refreshes(hass: HomeAssistant) -> None:
+    """Test overlapping refreshes notify a changed item once."""
+    controller = FakeCentralControl(groups=3, remotes=0, latency=0.05)
+    await controller.start()
+    coordinator, updates = await _async_setup_coordinator(hass, controller)
+
+    try:
+        await coordinator.async_refresh()
+        updates.clear()
+
+        controller.set_group_state(2, value=40)
+        await asyncio.gather(coordinator.async_refresh(), coordinator.async_refresh())
+
+        assert updates == [2]
+        assert coordinator.received == {1, 2, 3}
+        assert coordinator.skipped_writes == 3
+    finally:
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_fast_poll_of_active_items(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test only commanded items are polled fast until they settled."""
+    controller = FakeCentralControl(groups=3, remotes=0)
+    await controller.start()
+    coordinator, _ = await _async_setup_coordinator(hass, controller)
+
+    try:
+        await coordinator.async_refresh()
+        polls = controller.methods["deviced.group_get_state"]
+
+        # Items without feedback have no listener and are not polled fast.
+        coordinator.async_mark_active(99)
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        coordinator.async_mark_active(2)
+        assert coordinator.update_interval == FAST_SCAN_INTERVAL
+        await coordinator.async_refresh()
+        assert controller.methods["deviced.group_get_state"] == polls + 1
+        assert coordinator.received == {2}
+        assert coordinator.update_interval == FAST_SCAN_INTERVAL
+
+        monkeypatch.setattr(coordinator_module, "COMMAND_FAST_POLL_TIME", 0)
+        coordinator.async_mark_active(2)
+        await coordinator.async_refresh()
+        assert controller.methods["deviced.group_get_state"] == polls + 4
+        assert coordinator.received == {1, 2, 3}
+        assert coordinator.update_interval == coordinator.scan_interval
+    finally:
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_start_does_not_wait(hass: HomeAssistant) -> None:
+    """Test the first state is fetched in the background in one batch."""
+    controller = FakeCentralControl(groups=3, remotes=0, latency=0.2)
+    await controller.start()
+    coordinator, updates = await _async_setup_coordinator(hass, controller)
+
+    try:
+        coordinator.async_start()
+        assert coordinator.data is None
+
+        async with asyncio.timeout(5):
+            while coordinator.data is None:
+                await asyncio.sleep(0.01)
+
+        assert sorted(updates) == [1, 2, 3]
+        assert controller.methods["deviced.group_get_state"] == 3
+    finally:
+        await coordinator.async_shutdown()
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_listener_pushes_changes(hass: HomeAssistant) -> None:
+    """Test pushed changes only notify the entities of the changed item."""
+    controller = FakeCentralControl(groups=3, remotes=0, push=True)
+    await controller.start()
+    coordinator, updates = await _async_setup_coordinator(hass, controller)
+
+    try:
+        coordinator.async_start()
+        async with asyncio.timeout(5):
+            while not coordinator.listening or coordinator.data is None:
+                await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+
+        # The reset of the first long poll is the only full poll at start.
+        assert controller.methods["deviced.group_get_state"] == 3
+        updates.clear()
+
+        controller.set_group_state(2, value=40)
+        async with asyncio.timeout(5):
+            while coordinator.data[2]["value"] != 40:
+                await asyncio.sleep(0.01)
+
+        assert updates == [2]
+        assert coordinator.update_interval == LISTEN_SCAN_INTERVAL
+    finally:
+        await coordinator.async_shutdown()
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_safety_poll_while_pushing(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test continuous pushes do not postpone the safety poll."""
+    controller = FakeCentralControl(groups=3, remotes=0, push=True)
+    await controller.start()
+    coordinator, _ = await _async_setup_coordinator(hass, controller)
+
+    try:
+        coordinator.async_start()
+        async with asyncio.timeout(5):
+            while not coordinator.listening:
+                await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+        polls = controller.methods["deviced.group_get_state"]
+
+        for value in range(1, 5):
+            controller.set_group_state(2, value=value)
+            async with asyncio.timeout(5):
+                while coordinator.data[2]["value"] != value:
+                    await asyncio.sleep(0.01)
+            freezer.tick(LISTEN_SCAN_INTERVAL / 3)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+        assert controller.methods["deviced.group_get_state"] > polls
+    finally:
+        await coordinator.async_shutdown()
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_listener_not_supported(hass: HomeAssistant) -> None:
+    """Test polling continues if the controller cannot push changes."""
+    controller = FakeCentralControl(groups=3, remotes=0)
+    await controller.start()
+    coordinator, _ = await _async_setup_coordinator(hass, controller)
+
+    try:
+        coordinator.async_start()
+        async with asyncio.timeout(5):
+            while "deviced.wait_for_changes" not in controller.methods:
+                await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+
+        assert not coordinator.listening
+        assert coordinator.update_interval == SCAN_INTERVAL
+    finally:
+        await coordinator.async_shutdown()
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_scan_interval_follows_latency(hass: HomeAssistant) -> None:
+    """Test the scan interval follows the latency within the options."""
+    controller = FakeCentralControl(groups=3, remotes=0)
+    await controller.start()
+    coordinator, _ = await _async_setup_coordinator(
+        hass,
+        controller,
+        {CONF_SCAN_INTERVAL_MIN: 5, CONF_SCAN_INTERVAL_MAX: 60},
+    )
+    latency = coordinator.central_control.latency
+
+    try:
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        for _ in range(20):
+            latency.record(3, 0.01)
+        await coordinator.async_refresh()
+        assert coordinator.scan_interval == timedelta(seconds=5)
+        assert coordinator.update_interval == timedelta(seconds=5)
+
+        for _ in range(20):
+            latency.record(3, 20)
+        await coordinator.async_refresh()
+        assert coordinator.scan_interval == timedelta(seconds=60)
+    finally:
+        await coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_listener_given_up_after_errors(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a controller rejecting the long poll is not asked forever."""
+    monkeypatch.setattr(coordinator_module, "LISTEN_RETRY_DELAY", 0)
+    controller = FakeCentralControl(groups=3, remotes=0)
+    await controller.start()
+    coordinator, _ = await _async_setup_coordinator(hass, controller)
+    calls: list[int | None] = []
+
+    async def _reject(cursor: int | None = None) -> tuple[int, None]:
+        calls.append(cursor)
+        raise CentralControlError("deviced.wait_for_changes failed: invalid params")
+
+    coordinator.central_control.wait_for_changes = _reject
+
+    try:
+        await coordinator.async_refresh()
+        async with asyncio.timeout(5):
+            await coordinator._async_listen()
+
+        assert len(calls) == coordinator_module.LISTEN_MAX_ERRORS
+        assert not coordinator.listening
+    finally:
+        await coordinator.central_control.async_close()
+        await controller.stop()
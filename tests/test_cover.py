@@ -0,0 +1,152 @@
+"""Tests for the aggregate cover against the fake controller."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+)
+from custom_components.becker_centralcontrol_has.const import DOMAIN
+from custom_components.becker_centralcontrol_has.coordinator import (
+    CentralControlCoordinator,
+)
+from custom_components.becker_centralcontrol_has.cover import BeckerAggregateCover
+from custom_components.becker_centralcontrol_has.models import BeckerItem
+from homeassistant.const import CONF_ID, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .fake_controller import FakeCentralControl
+
+
+def _aggregate_cover(
+    hass: HomeAssistant, controller: FakeCentralControl, invert_position: bool = False
+) -> BeckerAggregateCover:
+    """Return an aggregate cover of all groups of the controller."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host_address": controller.address})
+    entry.add_to_hass(hass)
+    central_control = CentralControl(
+        address=controller.address, invert_position=invert_position
+    )
+    coordinator = CentralControlCoordinator(hass, entry, central_control)
+    members = [
+        BeckerItem.from_dict(group, invert_position)
+        for group in controller.groups.values()
+    ]
+    for item in members:
+        coordinator.async_add_listener(lambda: None, context=item.id)
+    return BeckerAggregateCover(
+        coordinator=coordinator,
+        entry_id=entry.entry_id,
+        name=entry.title,
+        aggregate={CONF_ID: "1", CONF_NAME: "All"},
+        members=members,
+    )
+
+
+async def test_position_is_mean_of_members(hass: HomeAssistant) -> None:
+    """Test the position is the mean of the member positions."""
+    controller = FakeCentralControl(groups=2, remotes=0, device_types=("shutter",))
+    await controller.start()
+    cover = _aggregate_cover(hass, controller)
+
+    try:
+        assert not cover.available
+
+        controller.set_group_state(1, value=100)
+        controller.set_group_state(2, value=100)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.available
+        assert cover.current_cover_position == 0
+        assert cover.is_closed is True
+
+        controller.set_group_state(2, value=50)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.current_cover_position == 25
+        assert cover.is_closed is None
+
+        controller.set_group_state(1, value=0)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.current_cover_position == 75
+        assert cover.is_closed is False
+    finally:
+        await cover.coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_opening_and_closing(hass: HomeAssistant) -> None:
+    """Test the covers are opening and closing while any member does."""
+    controller = FakeCentralControl(
+        groups=2, remotes=0, device_types=("shutter", "awning")
+    )
+    await controller.start()
+    cover = _aggregate_cover(hass, controller)
+
+    try:
+        # Moving down closes the shutter and opens the awning.
+        controller.set_group_state(1, moving_down=1)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.is_closing
+        assert not cover.is_opening
+
+        controller.set_group_state(2, moving_down=1)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.is_closing
+        assert cover.is_opening
+
+        controller.set_group_state(1, moving_down=0)
+        controller.set_group_state(2, moving_down=0)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert not cover.is_closing
+        assert not cover.is_opening
+    finally:
+        await cover.coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_closed_follows_invert_position(hass: HomeAssistant) -> None:
+    """Test invert_position and centronic members are respected when closed."""
+    controller = FakeCentralControl(groups=2, remotes=0, device_types=("shutter",))
+    await controller.start()
+    cover = _aggregate_cover(hass, controller, invert_position=True)
+
+    try:
+        controller.set_group_state(1, value=100)
+        controller.set_group_state(2, value=100)
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.current_cover_position == 100
+        assert cover.is_closed is True
+
+        controller.groups[2]["backend"] = "centronic"
+        cover._members[1] = BeckerItem.from_dict(controller.groups[2], True)
+        cover._update_from_coordinator()
+        assert cover.is_closed is None
+    finally:
+        await cover.coordinator.central_control.async_close()
+        await controller.stop()
+
+
+async def test_unavailable_after_failed_poll(hass: HomeAssistant) -> None:
+    """Test the covers become unavailable when polling fails."""
+    controller = FakeCentralControl(groups=2, remotes=0, device_types=("shutter",))
+    await controller.start()
+    cover = _aggregate_cover(hass, controller)
+
+    try:
+        await cover.coordinator.async_refresh()
+        cover._update_from_coordinator()
+        assert cover.available
+
+        await controller.stop()
+        await cover.coordinator.async_refresh()
+        assert not cover.available
+    finally:
+        await cover.coordinator.central_control.async_close()
+        await controller.stop()
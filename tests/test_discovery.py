@@ -0,0 +1,76 @@
+"""Tests for the discovery and its snapshot."""
+
+from __future__ import annotations
+
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+    CentralControlConnectionError,
+)
+from custom_components.becker_centralcontrol_has.discovery import (
+    async_discover,
+    async_load_snapshot,
+    async_remove_snapshot,
+    async_save_snapshot,
+)
+from homeassistant.core import HomeAssistant
+
+from .fake_controller import FakeCentralControl
+
+
+async def test_snapshot_roundtrip(
+    hass: HomeAssistant, fake_controller: FakeCentralControl
+) -> None:
+    """Test a saved discovery is restored without the CentralControl."""
+    central_control = CentralControl(address=fake_controller.address)
+    try:
+        discovery = await async_discover(central_control)
+    finally:
+        await central_control.async_close()
+    assert discovery is not None
+
+    assert await async_load_snapshot(hass, "entry") is None
+
+    await async_save_snapshot(hass, "entry", discovery)
+    restored = await async_load_snapshot(hass, "entry")
+
+    assert restored == discovery
+    assert restored.item_ids == {*fake_controller.groups, *fake_controller.remotes}
+
+    await async_remove_snapshot(hass, "entry")
+    assert await async_load_snapshot(hass, "entry") is None
+
+
+async def test_snapshot_applies_invert_position(
+    hass: HomeAssistant, fake_controller: FakeCentralControl
+) -> None:
+    """Test invert_position is applied when the snapshot is loaded."""
+    central_control = CentralControl(address=fake_controller.address)
+    try:
+        discovery = await async_discover(central_control)
+    finally:
+        await central_control.async_close()
+    await async_save_snapshot(hass, "entry", discovery)
+
+    restored = await async_load_snapshot(hass, "entry", invert_position=True)
+
+    assert all(item.reversed for items in restored.groups.values() for item in items)
+
+
+async def test_discover_without_parent_groups(
+    fake_controller: FakeCentralControl,
+) -> None:
+    """Test a failed parent group lookup does not fail the discovery."""
+    central_control = CentralControl(address=fake_controller.address)
+
+    async def _fail(group_ids) -> dict[int, list[int]]:
+        raise CentralControlConnectionError("timeout")
+
+    central_control.get_group_members = _fail
+    try:
+        discovery = await async_discover(central_control)
+    finally:
+        await central_control.async_close()
+
+    assert discovery is not None
+    assert discovery.members == {}
+    assert discovery.item_ids == {*fake_controller.groups, *fake_controller.remotes}
@@ -0,0 +1,112 @@
+"""Tests for the priority aware request limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.becker_centralcontrol_has.limiter import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestLimiter,
+)
+
+
+async def _hold(
+    limiter: RequestLimiter,
+    priority: int,
+    name: str,
+    order: list[str],
+    release: asyncio.Event,
+) -> None:
+    """Hold a slot until release is set and record when it was acquired."""
+    async with limiter.slot(priority):
+        order.append(name)
+        await release.wait()
+
+
+async def test_commands_overtake_polls() -> None:
+    """Test queued commands are served before queued polls."""
+    limiter = RequestLimiter(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    release.set()
+    blocker = asyncio.Event()
+
+    first = asyncio.create_task(_hold(limiter, PRIORITY_POLL, "first", order, blocker))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(_hold(limiter, priority, name, order, release))
+        for priority, name in (
+            (PRIORITY_POLL, "poll 1"),
+            (PRIORITY_POLL, "poll 2"),
+            (PRIORITY_COMMAND, "command"),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+
+    blocker.set()
+    await asyncio.gather(first, *tasks)
+
+    assert order == ["first", "command", "poll 1", "poll 2"]
+    assert limiter.queue_depth == 0
+    assert limiter.stats["active"] == 0
+
+
+async def test_cancelled_after_hand_over() -> None:
+    """Test a slot handed to a cancelled waiter is passed on."""
+    limiter = RequestLimiter(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    first = limiter.slot()
+    await first.__aenter__()
+    cancelled = asyncio.create_task(
+        _hold(limiter, PRIORITY_COMMAND, "cancelled", order, release)
+    )
+    waiting = asyncio.create_task(
+        _hold(limiter, PRIORITY_POLL, "waiting", order, release)
+    )
+    await asyncio.sleep(0)
+
+    # Hand the slot to the first waiter and cancel it before it runs.
+    await first.__aexit__(None, None, None)
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    async with asyncio.timeout(1):
+        await waiting
+
+    assert order == ["waiting"]
+    assert limiter.stats["active"] == 0
+    async with asyncio.timeout(1), limiter.slot():
+        pass
+
+
+async def test_queue_depth_and_wait_stats() -> None:
+    """Test waiting requests are counted and their wait is recorded."""
+    limiter = RequestLimiter(2)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_hold(limiter, PRIORITY_POLL, str(index), order, release))
+        for index in range(4)
+    ]
+    await asyncio.sleep(0.05)
+
+    stats = limiter.stats
+    assert stats["limit"] == 2
+    assert stats["active"] == 2
+    assert stats["queue_depth"] == 2
+    assert stats["acquired"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    stats = limiter.stats
+    assert stats["active"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["acquired"] == 4
+    assert stats["wait_max"] >= 0.05
+    assert 0 < stats["wait_avg"] < stats["wait_max"]
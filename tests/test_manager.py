@@ -0,0 +1,69 @@
+"""Tests for the manager shared by all CentralControls."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.becker_centralcontrol_has.central_control import (
+    CentralControl,
+)
+from custom_components.becker_centralcontrol_has.const import DOMAIN, SCAN_INTERVAL
+from custom_components.becker_centralcontrol_has.coordinator import (
+    CentralControlCoordinator,
+)
+from custom_components.becker_centralcontrol_has.manager import CentralControlManager
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .fake_controller import FakeCentralControl
+
+
+async def test_fleet_shares_budget_and_staggers_polls(hass: HomeAssistant) -> None:
+    """Test controllers share the limiter and their polls are staggered."""
+    manager = CentralControlManager(hass)
+    controllers = [FakeCentralControl(groups=2, remotes=0) for _ in range(3)]
+    coordinators: list[CentralControlCoordinator] = []
+    unregister = []
+
+    for controller in controllers:
+        await controller.start()
+        entry = MockConfigEntry(
+            domain=DOMAIN, data={"host_address": controller.address}
+        )
+        entry.add_to_hass(hass)
+        central_control = CentralControl(
+            address=controller.address,
+            session=manager.session,
+            shared_limiter=manager.limiter,
+        )
+        coordinator = CentralControlCoordinator(hass, entry, central_control)
+        coordinator.async_add_listener(lambda: None, context=1)
+        await coordinator.async_refresh()
+        coordinators.append(coordinator)
+        unregister.append(manager.async_register(coordinator))
+
+    try:
+        assert [controller.requests for controller in controllers] == [1, 1, 1]
+
+        # Only the later controllers poll once more to move their cycle.
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + SCAN_INTERVAL - timedelta(seconds=1)
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert [controller.requests for controller in controllers] == [1, 2, 2]
+
+        fleet = manager.as_dict()
+        assert fleet["controllers"] == 3
+        assert fleet["metrics"]["requests"] == 5
+        assert fleet["limiter"]["acquired"] == 5
+    finally:
+        for remove in unregister:
+            remove()
+        for coordinator, controller in zip(coordinators, controllers, strict=True):
+            await coordinator.async_shutdown()
+            await controller.stop()
@@ -0,0 +1,114 @@
+"""Tests for the request metrics."""
+
+from __future__ import annotations
+
+from custom_components.becker_centralcontrol_has.metrics import (
+    MethodMetrics,
+    RequestMetrics,
+)
+
+
+def test_counted_per_method_and_in_total() -> None:
+    """Test requests are counted under their method and in the total."""
+    metrics = RequestMetrics()
+
+    metrics.record_success("deviced.group_get_state", 3, 0.2, 100, 300)
+    metrics.record_failure("deviced.group_get_state", 3, 100, timeout=True)
+    metrics.record_failure("deviced.group_send_command", 1, 50, timeout=False)
+    metrics.record_success("deviced.wait_for_changes", 1, None, 40, 60)
+
+    result = metrics.as_dict()
+    assert result["deviced.group_get_state"] == {
+        "requests": 2,
+        "calls": 6,
+        "errors": 1,
+        "timeouts": 1,
+        "bytes_sent": 200,
+        "bytes_received": 300,
+        "latency_p50": 0.2,
+        "latency_p95": 0.2,
+        "latency_p99": 0.2,
+    }
+    assert result["deviced.group_send_command"]["errors"] == 1
+    assert result["deviced.group_send_command"]["timeouts"] == 0
+    # Long polls are recorded without latency.
+    assert result["deviced.wait_for_changes"]["latency_p50"] is None
+    assert result["total"] == {
+        "requests": 4,
+        "calls": 8,
+        "errors": 2,
+        "timeouts": 1,
+        "bytes_sent": 290,
+        "bytes_received": 360,
+        "latency_p50": 0.2,
+        "latency_p95": 0.2,
+        "latency_p99": 0.2,
+    }
+
+
+def test_method_key() -> None:
+    """Test mixed batches are counted under the joined method names."""
+    call = {"method": "deviced.group_get_state"}
+    other = {"method": "deviced.item_get_state"}
+
+    assert RequestMetrics.method_key(call) == "deviced.group_get_state"
+    assert RequestMetrics.method_key([call, call]) == "deviced.group_get_state"
+    assert (
+        RequestMetrics.method_key([other, call])
+        == "deviced.group_get_state+deviced.item_get_state"
+    )
+
+
+def test_percentiles() -> None:
+    """Test the percentiles pick the nearest rank of the kept samples."""
+    metrics = MethodMetrics()
+    assert metrics.percentile(50) is None
+
+    for latency in range(100, 0, -1):
+        metrics.add_latency(latency)
+    assert metrics.percentile(0) == 1
+    assert metrics.percentile(50) == 50
+    assert metrics.percentile(95) == 95
+    assert metrics.percentile(99) == 99
+    assert metrics.percentile(100) == 100
+
+
+def test_percentiles_of_recent_samples() -> None:
+    """Test only the most recent samples are kept."""
+    metrics = MethodMetrics(samples=4)
+
+    for latency in range(1, 7):
+        metrics.add_latency(latency)
+    assert metrics.percentile(0) == 3
+    assert metrics.percentile(50) == 4
+    assert metrics.percentile(100) == 6
+
+
+def test_merged() -> None:
+    """Test merged metrics sum the counters and keep all samples."""
+    first = MethodMetrics()
+    first.requests = 2
+    first.calls = 5
+    first.bytes_sent = 100
+    for latency in (1, 2, 3):
+        first.add_latency(latency)
+    second = MethodMetrics()
+    second.requests = 1
+    second.calls = 1
+    second.errors = 1
+    second.timeouts = 1
+    second.bytes_received = 40
+    second.add_latency(4)
+
+    assert MethodMetrics.merged([first, second]).as_dict() == {
+        "requests": 3,
+        "calls": 6,
+        "errors": 1,
+        "timeouts": 1,
+        "bytes_sent": 100,
+        "bytes_received": 40,
+        "latency_p50": 2,
+        "latency_p95": 4,
+        "latency_p99": 4,
+    }
+    assert MethodMetrics.merged([]).as_dict()["latency_p50"] is None
@@ -0,0 +1,98 @@
+"""Tests for the parsed items of the CentralControl."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.becker_centralcontrol_has.models import BeckerItem
+from homeassistant.components.cover import CoverDeviceClass, CoverEntityFeature
+
+
+def test_from_dict_minimal() -> None:
+    """Test an item with only an id gets defaults for the missing fields."""
+    item = BeckerItem.from_dict({"id": "7"})
+
+    assert item.id == 7
+    assert item.unique_id == "7"
+    assert item.name == "Unknown"
+    assert item.item_type is None
+    assert item.device_type is None
+    assert item.remote_type is None
+    assert item.backend is None
+    assert item.device_class is None
+    assert not item.feedback
+    assert not item.reversed
+
+
+def test_from_dict_group() -> None:
+    """Test the fields of a group are parsed."""
+    item = BeckerItem.from_dict(
+        {
+            "id": 3,
+            "item_type": "group",
+            "name": "Kitchen",
+            "device_type": "shutter",
+            "feedback": True,
+            "backend": "centronicplus",
+        }
+    )
+
+    assert item.id == 3
+    assert item.name == "Kitchen"
+    assert item.item_type == "group"
+    assert item.backend == "centronicplus"
+    assert item.device_class is CoverDeviceClass.SHUTTER
+
+
+@pytest.mark.parametrize(
+    ("feedback", "supported_features"),
+    [
+        (
+            True,
+            CoverEntityFeature.OPEN
+            | CoverEntityFeature.STOP
+            | CoverEntityFeature.CLOSE
+            | CoverEntityFeature.SET_POSITION,
+        ),
+        (
+            False,
+            CoverEntityFeature.OPEN
+            | CoverEntityFeature.STOP
+            | CoverEntityFeature.CLOSE,
+        ),
+        (
+            "true",
+            CoverEntityFeature.OPEN
+            | CoverEntityFeature.STOP
+            | CoverEntityFeature.CLOSE,
+        ),
+    ],
+)
+def test_from_dict_feedback(
+    feedback: object, supported_features: CoverEntityFeature
+) -> None:
+    """Test only items with feedback can be set to a position."""
+    item = BeckerItem.from_dict({"id": 1, "feedback": feedback})
+
+    assert item.feedback is (feedback is True)
+    assert item.supported_features == supported_features
+
+
+@pytest.mark.parametrize(
+    ("device_type", "invert_position", "reversed_"),
+    [
+        ("shutter", False, False),
+        ("shutter", True, True),
+        ("awning", False, True),
+        ("awning", True, True),
+    ],
+)
+def test_from_dict_reversed(
+    device_type: str, invert_position: bool, reversed_: bool
+) -> None:
+    """Test awnings and every item with invert_position are reversed."""
+    item = BeckerItem.from_dict(
+        {"id": 1, "device_type": device_type}, invert_position=invert_position
+    )
+
+    assert item.reversed is reversed_
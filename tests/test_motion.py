@@ -0,0 +1,79 @@
+"""Tests for the cover motion model."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.becker_centralcontrol_has.motion import (
+    DEFAULT_TRAVEL_TIME,
+    CoverMotion,
+)
+
+
+def test_interpolates_between_polls() -> None:
+    """Test the value moves on between polls and polls correct it."""
+    motion = CoverMotion(travel_time=20)
+
+    motion.observe(0, 1, now=0)
+    assert motion.value(5) == pytest.approx(25)
+    assert motion.value(60) == 100
+
+    motion.observe(30, 1, now=5)
+    assert motion.value(5) == 30
+
+    motion.observe(40, 0, now=7)
+    assert motion.direction == 0
+    assert motion.value(100) == 40
+
+
+def test_learns_travel_time() -> None:
+    """Test the travel time converges to the observed speed."""
+    motion = CoverMotion()
+
+    for step in range(80):
+        motion.observe(100 - step * 1.25, -1, now=step * 0.5)
+
+    # 2.5 steps per second make 40 s for a full travel.
+    assert motion.travel_time == pytest.approx(40, rel=0.01)
+
+
+def test_ignores_short_samples() -> None:
+    """Test measurements below the minimum time or distance are skipped."""
+    motion = CoverMotion()
+
+    motion.observe(50, 1, now=0)
+    motion.observe(60, 1, now=1.5)
+    motion.observe(62, 0, now=10)
+    motion.observe(62, 1, now=10)
+    motion.observe(64, 1, now=20)
+
+    assert motion.travel_time == DEFAULT_TRAVEL_TIME
+
+
+def test_estimates_without_feedback() -> None:
+    """Test commands alone give an estimated position."""
+    motion = CoverMotion(travel_time=10)
+    assert motion.value(0) is None
+
+    motion.command(1, now=0)
+    assert motion.value(0) == 0
+    assert motion.value(4) == pytest.approx(40)
+    assert not motion.arrived(4)
+    assert motion.arrived(10)
+
+    motion.stop(now=4)
+    assert motion.value(100) == pytest.approx(40)
+
+    motion.command(-1, now=10, target=20)
+    assert motion.value(100) == 20
+    assert motion.arrived(100)
+
+
+def test_stop_without_value() -> None:
+    """Test a stop without known value keeps the value unknown."""
+    motion = CoverMotion()
+
+    motion.stop(now=0)
+
+    assert motion.value(0) is None
+    assert motion.direction == 0
@@ -0,0 +1,56 @@
+"""Tests for the rolling sensor statistics."""
+
+from __future__ import annotations
+
+from custom_components.becker_centralcontrol_has.stats import RollingWindow
+
+
+def test_empty_window() -> None:
+    """Test an empty window has no statistics."""
+    window = RollingWindow(60, 10)
+
+    assert window.stats(now=0) == {"max": None, "mean": None, "gust": None}
+    assert len(window) == 0
+
+
+def test_statistics_of_the_window() -> None:
+    """Test maximum, mean and gust cover the readings within the window."""
+    window = RollingWindow(60, 10)
+    for now, value in ((0, 2), (10, 8), (20, 5)):
+        window.add(value, now)
+
+    assert window.stats(now=20) == {"max": 8, "mean": 5, "gust": 3}
+    assert len(window) == 3
+    # The maximum expires with its reading.
+    assert window.stats(now=75) == {"max": 5, "mean": 5, "gust": 0}
+    assert len(window) == 1
+    assert window.stats(now=81)["max"] is None
+    assert len(window) == 0
+
+
+def test_capacity_drops_oldest() -> None:
+    """Test a full window drops the oldest reading."""
+    window = RollingWindow(60, 3)
+    for now, value in enumerate((9, 1, 2, 3)):
+        window.add(value, now)
+
+    assert window.stats(now=3) == {"max": 3, "mean": 2, "gust": 1}
+    assert len(window) == 3
+
+
+def test_matches_recomputed_statistics() -> None:
+    """Test the incremental statistics match recomputing them."""
+    window = RollingWindow(30, 20)
+    readings: list[tuple[float, float]] = []
+    for step in range(500):
+        now = step * 0.7
+        value = (step * 37 % 11) / 2
+        window.add(value, now)
+        readings = [(t, v) for t, v in readings if t >= now - 30][-19:]
+        readings.append((now, value))
+        values = [v for _, v in readings]
+
+        stats = window.stats(now)
+        assert len(window) == len(values)
+        assert stats["max"] == round(max(values), 1)
+        assert abs(stats["mean"] - sum(values) / len(values)) <= 0.05
@@ -0,0 +1,40 @@
+"""Tests for the sensor publish throttle."""
+
+from __future__ import annotations
+
+from custom_components.becker_centralcontrol_has.throttle import PublishThrottle
+
+
+def test_unlimited_publishes_every_change() -> None:
+    """Test the defaults publish every change right away."""
+    throttle = PublishThrottle()
+
+    assert throttle.delay(1, now=0) == 0
+    throttle.publish(1, now=0)
+    assert throttle.delay(1, now=0) is None
+    assert throttle.delay(1.1, now=0) == 0
+
+
+def test_deadband_holds_back_small_changes() -> None:
+    """Test changes within the deadband wait for the heartbeat."""
+    throttle = PublishThrottle(deadband=1)
+    throttle.publish(5, now=0)
+
+    assert throttle.delay(5.5, now=10) is None
+    assert throttle.delay(6, now=10) == 0
+    assert throttle.delay(4, now=10) == 0
+
+    throttle.heartbeat = 300
+    assert throttle.delay(5.5, now=10) == 290
+    assert throttle.delay(5.5, now=400) == 0
+
+
+def test_min_interval_defers_changes() -> None:
+    """Test changes are published at most once per minimum interval."""
+    throttle = PublishThrottle(min_interval=60, heartbeat=30, deadband=2)
+    throttle.publish(5, now=0)
+
+    assert throttle.delay(10, now=20) == 40
+    assert throttle.delay(10, now=90) == 0
+    # The heartbeat does not undercut the minimum interval.
+    assert throttle.delay(6, now=20) == 40
@@ -0,0 +1,64 @@
+"""Tests for the latency model tuning timeouts and poll intervals."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.becker_centralcontrol_has.tuning import (
+    MIN_SAMPLES,
+    POLL_DUTY_CYCLE,
+    LatencyModel,
+)
+
+
+def test_default_timeout_until_measured() -> None:
+    """Test the default timeout is used until enough latencies were measured."""
+    model = LatencyModel(default_timeout=10, min_timeout=1, max_timeout=30)
+    for _ in range(MIN_SAMPLES - 1):
+        model.record(1, 0.1)
+
+    assert model.timeout(1) == 10
+    assert model.poll_interval(10) is None
+
+    model.record(1, 0.1)
+    assert model.timeout(1) == 1
+    assert model.poll_interval(10) is not None
+
+
+def test_fits_round_trip_and_service_time() -> None:
+    """Test latencies of different batch sizes are split into RTT and service."""
+    model = LatencyModel(default_timeout=10, min_timeout=0, max_timeout=30)
+    for step in range(200):
+        calls = (1, 5, 20, 40)[step % 4]
+        model.record(calls, 0.05 + 0.02 * calls)
+
+    assert model.rtt == pytest.approx(0.05, abs=1e-3)
+    assert model.service_time == pytest.approx(0.02, abs=1e-4)
+    assert model.timeout(40) == pytest.approx(0.85, abs=0.01)
+    assert model.poll_interval(40) == pytest.approx(0.85 / POLL_DUTY_CYCLE, abs=0.1)
+
+
+def test_deviation_widens_timeout() -> None:
+    """Test jittering latencies get a larger timeout than steady ones."""
+    steady = LatencyModel(default_timeout=10, min_timeout=0, max_timeout=30)
+    jittery = LatencyModel(default_timeout=10, min_timeout=0, max_timeout=30)
+    for step in range(50):
+        steady.record(1, 0.5)
+        jittery.record(1, 0.5 + (0.4 if step % 2 else -0.4))
+
+    assert steady.timeout(1) == pytest.approx(0.5, abs=0.01)
+    assert jittery.timeout(1) > 1.5
+
+
+def test_timeout_backs_off() -> None:
+    """Test timeouts double the timeout until a request succeeds."""
+    model = LatencyModel(default_timeout=10, min_timeout=2, max_timeout=30)
+
+    model.record_timeout()
+    assert model.timeout(1) == 20
+    model.record_timeout()
+    model.record_timeout()
+    assert model.timeout(1) == 30
+
+    model.record(1, 0.1)
+    assert model.timeout(1) == 10